@@ -65,6 +65,14 @@ DATABASES = {
 }
 
 
+# Store the object ids of the translations as integers if set, the sample
+# models with non-integer primary keys are only tested with strings then
+TRANSLATIONS_INTEGER_OBJECT_ID = \
+    os.environ.get('EXAMPLE_INTEGER_OBJECT_ID', '') == 'true'
+if TRANSLATIONS_INTEGER_OBJECT_ID:
+    SILENCED_SYSTEM_CHECKS = ['translations.E001']
+
+
 # Read logging configuration from environment variables
 LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
 LOGGING = {
@@ -0,0 +1,3 @@
+# the test models live in the modules which only the tests import
+# (e.g. `tests.storage_models`), so they stay out of the docs.
+# this module makes the test database create their tables
@@ -0,0 +1,51 @@
+from django.db import models
+try:
+    from django.utils.translation import ugettext_lazy as _
+except ImportError:
+    from django.utils.translation import gettext_lazy as _
+
+from translations.models import Translatable
+from translations.storages import JSONStorage
+
+from sample.models import City
+
+
+# only the tests import this module, so the landmarks (and their content
+# type) stay out of the sample which the docs run against.
+# the translations storages need the `JSONField` of Django 3.1
+if hasattr(models, 'JSONField'):
+    class Landmark(Translatable):
+        name = models.CharField(
+            verbose_name=_('name'),
+            help_text=_('the name of the landmark'),
+            max_length=64,
+        )
+        description = models.TextField(
+            verbose_name=_('description'),
+            help_text=_('the description of the landmark'),
+            blank=True,
+        )
+        city = models.ForeignKey(
+            verbose_name=_('city'),
+            help_text=_('the city of the landmark'),
+            to=City,
+            on_delete=models.CASCADE,
+            related_name='landmarks',
+        )
+        translations_data = models.JSONField(
+            verbose_name=_('translations data'),
+            help_text=_('the translations of the landmark'),
+            default=dict,
+            blank=True,
+        )
+
+        def __str__(self):
+            return self.name
+
+        class Meta:
+            verbose_name = _('landmark')
+            verbose_name_plural = _('landmarks')
+
+        class TranslatableMeta:
+            fields = ['name', 'description']
+            storage = JSONStorage('translations_data')
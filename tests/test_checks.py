@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+from tests.test_case import TranslationTestCase
+from django.test import override_settings
+from django.test.utils import isolate_apps
+from django.db import models
+
+from translations.checks import check_object_ids
+from translations.models import Translatable
+
+from sample.models import Continent, Country
+
+
+class CheckObjectIdsTest(TranslationTestCase):
+    """Tests for `check_object_ids`."""
+
+    def test_char_object_ids(self):
+        self.assertListEqual(check_object_ids(), [])
+
+    @override_settings(TRANSLATIONS_INTEGER_OBJECT_ID=True)
+    def test_integer_object_ids(self):
+        errors = check_object_ids()
+
+        self.assertListEqual(
+            [error.obj for error in errors],
+            [Continent, Country]
+        )
+        self.assertListEqual(
+            [error.id for error in errors],
+            ['translations.E001', 'translations.E001']
+        )
+
+    @override_settings(TRANSLATIONS_INTEGER_OBJECT_ID=True)
+    @isolate_apps('tests')
+    def test_integer_object_ids_relation_pks(self):
+        class Place(Translatable):
+            pass
+
+        class Museum(Place):
+            pass
+
+        class Code(Translatable):
+            code = models.CharField(max_length=2, primary_key=True)
+
+        class Airport(Translatable):
+            code = models.OneToOneField(
+                Code, on_delete=models.CASCADE, primary_key=True,
+            )
+
+        with patch(
+            'translations.checks.apps.get_models',
+            return_value=[Place, Museum, Code, Airport],
+        ):
+            errors = check_object_ids()
+
+        self.assertListEqual(
+            [error.obj for error in errors],
+            [Code, Airport]
+        )
@@ -1,7 +1,20 @@
+from unittest import skipUnless
+
+import django
 from tests.test_case import TranslationTestCase
+from django.test import override_settings, skipUnlessDBFeature
 from django.utils.translation import override
+from django.db import connection
+from django.core.cache import caches
+from django.contrib.contenttypes.models import ContentType
+from django.test.utils import CaptureQueriesContext
+try:
+    from asgiref.sync import sync_to_async
+except ImportError:
+    sync_to_async = None
 
 from translations.context import Context
+from translations.models import Translation
 
 from sample.models import Continent
 from sample.utils import create_samples
@@ -7641,3 +7654,821 @@ class ContextTest(TranslationTestCase):
         self.assertEqual(south_korea.denonym, 'South Korean')
         self.assertEqual(seoul.name, 'Seoul')
         self.assertEqual(seoul.denonym, 'Seouler')
+
+    def test_read_chunked_queryset_level_1_2_relation_with_lang(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            city_names=['cologne', 'seoul'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        lvl_1_2 = ('countries', 'countries__cities',)
+
+        continents = Continent.objects.prefetch_related(*lvl_1_2)
+        with Context(continents, *lvl_1_2) as context:
+            context.chunk_size = 3
+            with self.assertNumQueries(3):
+                context.read('de')
+            europe = [x for x in continents if x.code == 'EU'][0]
+            germany = europe.countries.all()[0]
+            cologne = germany.cities.all()[0]
+            asia = [x for x in continents if x.code == 'AS'][0]
+            south_korea = asia.countries.all()[0]
+            seoul = south_korea.cities.all()[0]
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+        self.assertEqual(germany.name, 'Deutschland')
+        self.assertEqual(germany.denonym, 'Deutsche')
+        self.assertEqual(cologne.name, 'Köln')
+        self.assertEqual(cologne.denonym, 'Kölner')
+        self.assertEqual(asia.name, 'Asien')
+        self.assertEqual(asia.denonym, 'Asiatisch')
+        self.assertEqual(south_korea.name, 'Südkorea')
+        self.assertEqual(south_korea.denonym, 'Südkoreanisch')
+        self.assertEqual(seoul.name, 'Seül')
+        self.assertEqual(seoul.denonym, 'Seüler')
+
+    def test_update_chunked_queryset_level_1_2_relation_with_lang(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            city_names=['cologne', 'seoul'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        lvl_1_2 = ('countries', 'countries__cities',)
+
+        continents = Continent.objects.prefetch_related(*lvl_1_2)
+        with Context(continents, *lvl_1_2) as context:
+            context.chunk_size = 3
+            europe = [x for x in continents if x.code == 'EU'][0]
+            germany = europe.countries.all()[0]
+            cologne = germany.cities.all()[0]
+            asia = [x for x in continents if x.code == 'AS'][0]
+            south_korea = asia.countries.all()[0]
+            seoul = south_korea.cities.all()[0]
+
+            europe.name = 'Europe Name'
+            germany.name = 'Germany Name'
+            cologne.name = 'Cologne Name'
+            asia.name = 'Asia Name'
+            south_korea.name = 'South Korea Name'
+            seoul.name = 'Seoul Name'
+
+            context.update('de')
+        with Context(continents, *lvl_1_2) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europe Name')
+        self.assertEqual(europe.denonym, 'Europäisch')
+        self.assertEqual(germany.name, 'Germany Name')
+        self.assertEqual(germany.denonym, 'Deutsche')
+        self.assertEqual(cologne.name, 'Cologne Name')
+        self.assertEqual(cologne.denonym, 'Kölner')
+        self.assertEqual(asia.name, 'Asia Name')
+        self.assertEqual(asia.denonym, 'Asiatisch')
+        self.assertEqual(south_korea.name, 'South Korea Name')
+        self.assertEqual(south_korea.denonym, 'Südkoreanisch')
+        self.assertEqual(seoul.name, 'Seoul Name')
+        self.assertEqual(seoul.denonym, 'Seüler')
+
+    def test_delete_chunked_queryset_level_1_2_relation_with_lang(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            city_names=['cologne', 'seoul'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        lvl_1_2 = ('countries', 'countries__cities',)
+
+        continents = Continent.objects.prefetch_related(*lvl_1_2)
+        with Context(continents, *lvl_1_2) as context:
+            context.chunk_size = 3
+            context.delete('de')
+        with Context(continents, *lvl_1_2) as context:
+            context.read('de')
+            europe = [x for x in continents if x.code == 'EU'][0]
+            germany = europe.countries.all()[0]
+            cologne = germany.cities.all()[0]
+            asia = [x for x in continents if x.code == 'AS'][0]
+            south_korea = asia.countries.all()[0]
+            seoul = south_korea.cities.all()[0]
+
+        self.assertEqual(europe.name, 'Europe')
+        self.assertEqual(europe.denonym, 'European')
+        self.assertEqual(germany.name, 'Germany')
+        self.assertEqual(germany.denonym, 'German')
+        self.assertEqual(cologne.name, 'Cologne')
+        self.assertEqual(cologne.denonym, 'Cologner')
+        self.assertEqual(asia.name, 'Asia')
+        self.assertEqual(asia.denonym, 'Asian')
+        self.assertEqual(south_korea.name, 'South Korea')
+        self.assertEqual(south_korea.denonym, 'South Korean')
+        self.assertEqual(seoul.name, 'Seoul')
+        self.assertEqual(seoul.denonym, 'Seouler')
+
+    def test_read_queryset_without_content_type_join(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            with CaptureQueriesContext(connection) as captured:
+                context.read('de')
+            europe = [x for x in continents if x.code == 'EU'][0]
+            asia = [x for x in continents if x.code == 'AS'][0]
+
+        self.assertEqual(len(captured.captured_queries), 1)
+        self.assertNotIn(
+            'django_content_type',
+            captured.captured_queries[0]['sql']
+        )
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+        self.assertEqual(asia.name, 'Asien')
+        self.assertEqual(asia.denonym, 'Asiatisch')
+
+    def test_read_queryset_fallback_langs(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+        Translation.objects.filter(
+            language='tr',
+            field='denonym',
+        ).delete()
+
+        lvl_1 = ('countries',)
+
+        continents = Continent.objects.prefetch_related(*lvl_1)
+        with Context(continents, *lvl_1) as context:
+            with self.assertNumQueries(1):
+                context.read(['tr', 'de'])
+            europe = [x for x in continents if x.code == 'EU'][0]
+            germany = europe.countries.all()[0]
+            asia = [x for x in continents if x.code == 'AS'][0]
+            south_korea = asia.countries.all()[0]
+
+        self.assertEqual(europe.name, 'Avrupa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+        self.assertEqual(germany.name, 'Almanya')
+        self.assertEqual(germany.denonym, 'Deutsche')
+        self.assertEqual(asia.name, 'Asya')
+        self.assertEqual(asia.denonym, 'Asiatisch')
+        self.assertEqual(south_korea.name, 'Güney Kore')
+        self.assertEqual(south_korea.denonym, 'Südkoreanisch')
+
+    @override_settings(TRANSLATIONS_FALLBACK_LANGUAGES={'en-gb': ['de']})
+    def test_read_queryset_settings_fallback_langs(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            with self.assertNumQueries(1):
+                context.read('en-gb')
+            europe = [x for x in continents if x.code == 'EU'][0]
+            asia = [x for x in continents if x.code == 'AS'][0]
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+        self.assertEqual(asia.name, 'Asien')
+        self.assertEqual(asia.denonym, 'Asiatisch')
+
+    def test_read_queryset_fallback_langs_with_default(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            context.read('de')
+            with self.assertNumQueries(0):
+                context.read(['en', 'de'])
+            europe = [x for x in continents if x.code == 'EU'][0]
+
+        self.assertEqual(europe.name, 'Europe')
+        self.assertEqual(europe.denonym, 'European')
+
+    @skipUnlessDBFeature('supports_update_conflicts_with_target')
+    def test_update_queryset_upsert_keeps_translations(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        ids = set(Translation.objects.values_list('id', flat=True))
+
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            europe = [x for x in continents if x.code == 'EU'][0]
+            europe.name = 'Europe Name'
+            with CaptureQueriesContext(connection) as captured:
+                context.update('de')
+        with Context(continents) as context:
+            context.read('de')
+
+        self.assertFalse(any(
+            query['sql'].startswith('DELETE')
+            for query in captured.captured_queries
+        ))
+        self.assertEqual(
+            set(Translation.objects.values_list('id', flat=True)),
+            ids
+        )
+        self.assertEqual(europe.name, 'Europe Name')
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+    def test_update_queryset_no_upsert(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            context._get_upsert_options = lambda using: None
+            europe = [x for x in continents if x.code == 'EU'][0]
+            asia = [x for x in continents if x.code == 'AS'][0]
+            europe.name = 'Europe Name'
+            asia.denonym = 'Asia Denonym'
+            counts = context.update('de')
+        with Context(continents) as context:
+            context.read('de')
+
+        self.assertDictEqual(
+            counts,
+            {'created': 0, 'updated': 2, 'deleted': 0}
+        )
+        self.assertEqual(europe.name, 'Europe Name')
+        self.assertEqual(europe.denonym, 'Europäisch')
+        self.assertEqual(asia.name, 'Asien')
+        self.assertEqual(asia.denonym, 'Asia Denonym')
+        self.assertEqual(
+            Translation.objects.filter(language='de').count(),
+            4
+        )
+
+    def test_update_queryset_counts(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+        Translation.objects.filter(
+            language='de',
+            field='denonym',
+        ).delete()
+
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            context.read('de')
+            europe = [x for x in continents if x.code == 'EU'][0]
+            asia = [x for x in continents if x.code == 'AS'][0]
+            europe.name = 'Europe Name'
+            europe.denonym = 'Europe Denonym'
+            asia.name = ''
+            counts = context.update('de')
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            context.read('de')
+            europe = [x for x in continents if x.code == 'EU'][0]
+            asia = [x for x in continents if x.code == 'AS'][0]
+
+        self.assertDictEqual(
+            counts,
+            {'created': 1, 'updated': 1, 'deleted': 1}
+        )
+        self.assertEqual(europe.name, 'Europe Name')
+        self.assertEqual(europe.denonym, 'Europe Denonym')
+        self.assertEqual(asia.name, 'Asia')
+        self.assertEqual(asia.denonym, 'Asian')
+
+    def test_update_queryset_no_changes(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            context.read('de')
+            with CaptureQueriesContext(connection) as captured:
+                counts = context.update('de')
+
+        self.assertDictEqual(
+            counts,
+            {'created': 0, 'updated': 0, 'deleted': 0}
+        )
+        self.assertFalse(any(
+            query['sql'].startswith(('INSERT', 'UPDATE', 'DELETE'))
+            for query in captured.captured_queries
+        ))
+
+    def test_update_default_lang_counts(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            counts = context.update('en')
+
+        self.assertDictEqual(
+            counts,
+            {'created': 0, 'updated': 0, 'deleted': 0}
+        )
+
+    def test_read_queryset_fields(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        lvl_1 = ('countries',)
+
+        continents = Continent.objects.prefetch_related(*lvl_1)
+        with Context(continents, *lvl_1, fields=['name']) as context:
+            context.read('de')
+            europe = [x for x in continents if x.code == 'EU'][0]
+            germany = europe.countries.all()[0]
+
+        self.assertDictEqual(
+            europe._get_default_translatable_fields(),
+            {'name': 'Europe'}
+        )
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'European')
+        self.assertEqual(germany.name, 'Deutschland')
+        self.assertEqual(germany.denonym, 'German')
+
+    def test_update_queryset_fields(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = list(Continent.objects.all())
+        with Context(continents, fields=['denonym']) as context:
+            europe = [x for x in continents if x.code == 'EU'][0]
+            europe.name = 'Europe Name'
+            europe.denonym = 'Europe Denonym'
+            counts = context.update('de')
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            context.read('de')
+            europe = [x for x in continents if x.code == 'EU'][0]
+
+        self.assertDictEqual(
+            counts,
+            {'created': 0, 'updated': 1, 'deleted': 0}
+        )
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'Europe Denonym')
+
+    def test_delete_queryset_fields(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = list(Continent.objects.all())
+        with Context(continents, fields=['name']) as context:
+            context.delete('de')
+        with Context(continents) as context:
+            context.read('de')
+            europe = [x for x in continents if x.code == 'EU'][0]
+
+        self.assertEqual(europe.name, 'Europe')
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+    def test_reset_queryset_fields(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            context.read('de')
+        with Context(continents, fields=['name']) as context:
+            context.reset()
+            europe = [x for x in continents if x.code == 'EU'][0]
+
+        self.assertEqual(europe.name, 'Europe')
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+    def test_read_fields_keeps_defaults(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = list(Continent.objects.all())
+        with Context(continents, fields=['name']) as context:
+            context.read('de')
+        with Context(continents) as context:
+            europe = [x for x in continents if x.code == 'EU'][0]
+            europe.denonym = 'Europe Denonym'
+
+            self.assertDictEqual(
+                europe._get_default_translatable_fields(),
+                {'name': 'Europe', 'denonym': 'European'}
+            )
+            self.assertListEqual(
+                list(context._get_changed_fields()),
+                [
+                    ({
+                        'content_type_id': europe.translations.content_type.id,
+                        'object_id': 'EU',
+                        'field': 'denonym',
+                    }, 'Europe Denonym'),
+                ]
+            )
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_read_cache_num_queries(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+        caches['default'].clear()
+
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            with CaptureQueriesContext(connection) as first:
+                context.read('de')
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            with CaptureQueriesContext(connection) as second:
+                context.read('de')
+            europe = [x for x in continents if x.code == 'EU'][0]
+
+        # the presences and the translations
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 0)
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_read_cache_untranslated_num_queries(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+        )
+        caches['default'].clear()
+
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            context.read('de')
+        with Context(continents) as context:
+            with CaptureQueriesContext(connection) as captured:
+                context.read('de')
+            europe = [x for x in continents if x.code == 'EU'][0]
+
+        self.assertEqual(len(captured), 0)
+        self.assertEqual(europe.name, 'Europe')
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_read_cache_misses_num_queries(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+        caches['default'].clear()
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            with CaptureQueriesContext(connection) as captured:
+                context.read('de')
+            europe = [x for x in continents if x.code == 'EU'][0]
+            asia = [x for x in continents if x.code == 'AS'][0]
+
+        # the bucket of the presence and the translations
+        self.assertEqual(len(captured), 2)
+        self.assertIn("'AS'", captured[1]['sql'])
+        self.assertNotIn("'EU'", captured[1]['sql'])
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(asia.name, 'Asien')
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_read_cache_fields(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+        caches['default'].clear()
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe, fields=['name']) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'European')
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            with CaptureQueriesContext(connection) as captured:
+                context.read('de')
+
+        self.assertEqual(len(captured), 0)
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_read_cache_fallback(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+        caches['default'].clear()
+        Translation.objects.filter(
+            language='tr', field='name', object_id='EU'
+        ).delete()
+
+        for _ in range(2):
+            europe = Continent.objects.get(code='EU')
+            with Context(europe) as context:
+                context.read(['tr', 'de'])
+
+            self.assertEqual(europe.name, 'Europa')
+            self.assertEqual(europe.denonym, 'Avrupalı')
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_update_cache_cleared(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+        caches['default'].clear()
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+            europe.name = 'Europa Name'
+            context.update('de')
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa Name')
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_update_cache_bumped_once(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name'],
+            langs=['de', 'tr']
+        )
+        ct_id = ContentType.objects.get_for_model(Continent).id
+        cache = caches['default']
+        cache.clear()
+        cache.set('translations:generation:{}:de'.format(ct_id), 5)
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            europe.name = 'Europa Name'
+            europe.denonym = 'Europäisch'
+            with CaptureQueriesContext(connection) as captured:
+                context.update('de')
+
+        self.assertEqual(
+            cache.get('translations:generation:{}:de'.format(ct_id)),
+            6
+        )
+        self.assertFalse(
+            any('DISTINCT' in query['sql'] for query in captured)
+        )
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_create_cache_cleared(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+        )
+        caches['default'].clear()
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+            europe.name = 'Europa'
+            context.create('de')
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa')
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_create_cache_bumped_once(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+        )
+        ct_id = ContentType.objects.get_for_model(Continent).id
+        cache = caches['default']
+        cache.clear()
+        cache.set('translations:generation:{}:de'.format(ct_id), 5)
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            europe.name = 'Europa'
+            context.create('de')
+
+        self.assertEqual(
+            cache.get('translations:generation:{}:de'.format(ct_id)),
+            6
+        )
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_delete_cache_cleared(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+        caches['default'].clear()
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+            context.delete('de')
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europe')
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_save_cache_cleared(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+        caches['default'].clear()
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+        translation = Translation.objects.get(
+            language='de', field='name', object_id='EU'
+        )
+        translation.text = 'Europa Text'
+        translation.save()
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europa Text')
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_read_cache_presences_skip_query(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        caches['default'].clear()
+
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            with CaptureQueriesContext(connection) as captured:
+                context.read('tr')
+            europe = [x for x in continents if x.code == 'EU'][0]
+
+        # only the presences
+        self.assertEqual(len(captured), 1)
+        self.assertEqual(europe.name, 'Europe')
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_read_cache_presences_skip_objects(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        Translation.objects.filter(object_id='AS').delete()
+        caches['default'].clear()
+
+        continents = list(Continent.objects.all())
+        with Context(continents) as context:
+            with CaptureQueriesContext(connection) as captured:
+                context.read('de')
+            europe = [x for x in continents if x.code == 'EU'][0]
+
+        self.assertEqual(len(captured), 2)
+        self.assertIn("'EU'", captured[1]['sql'])
+        self.assertNotIn("'AS'", captured[1]['sql'])
+        self.assertEqual(europe.name, 'Europa')
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_create_translation_presences_cleared(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        caches['default'].clear()
+
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('tr')
+        Translation.objects.create(
+            content_type=europe.translations.content_type,
+            object_id='EU',
+            field='name',
+            language='tr',
+            text='Avrupa',
+        )
+        europe = Continent.objects.get(code='EU')
+        with Context(europe) as context:
+            context.read('tr')
+
+        self.assertEqual(europe.name, 'Avrupa')
+
+    @skipUnless(django.VERSION >= (4, 1), 'the async queries need Django 4.1')
+    async def test_aread_queryset(self):
+        await sync_to_async(create_samples)(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = [x async for x in Continent.objects.order_by('code')]
+        context = await sync_to_async(Context)(continents)
+        async with context:
+            await context.aread('de')
+
+        self.assertEqual(continents[0].name, 'Asien')
+        self.assertEqual(continents[1].name, 'Europa')
+
+    @skipUnless(django.VERSION >= (4, 1), 'the async queries need Django 4.1')
+    async def test_acreate_aupdate_adelete_instance(self):
+        await sync_to_async(create_samples)(
+            continent_names=['europe'],
+        )
+
+        europe = await Continent.objects.aget(code='EU')
+        context = await sync_to_async(Context)(europe)
+        europe.name = 'Europa'
+        await context.acreate('de')
+        europe.name = 'Kontinent Europa'
+        counts = await context.aupdate('de')
+
+        self.assertEqual(counts['updated'], 1)
+        self.assertEqual(
+            await Translation.objects.filter(language='de').aget(),
+            await Translation.objects.aget(text='Kontinent Europa'),
+        )
+
+        await context.adelete('de')
+
+        self.assertIs(
+            await Translation.objects.filter(language='de').aexists(),
+            False
+        )
@@ -6,7 +6,7 @@ from translations.languages import _get_supported_language, \
     _get_default_language, _get_active_language, \
     _get_all_languages, _get_all_choices, \
     _get_translation_languages, _get_translation_choices, \
-    _get_translate_language, _get_probe_language, \
+    _get_translate_language, _get_fallback_languages, _get_probe_language, \
     translate, probe
 
 
@@ -301,6 +301,80 @@ class GetTranslateLanguageTest(TranslationTestCase):
         )
 
 
+class GetFallbackLanguagesTest(TranslationTestCase):
+    """Tests for `_get_fallback_languages`."""
+
+    @override(language='de', deactivate=True)
+    def test_active(self):
+        self.assertListEqual(
+            _get_fallback_languages(),
+            ['de']
+        )
+
+    @override(language='en', deactivate=True)
+    def test_default_active(self):
+        self.assertListEqual(
+            _get_fallback_languages(),
+            []
+        )
+
+    def test_one_custom(self):
+        self.assertListEqual(
+            _get_fallback_languages('de'),
+            ['de']
+        )
+
+    def test_many_custom(self):
+        self.assertListEqual(
+            _get_fallback_languages(['tr', 'de-at', 'tr']),
+            ['tr', 'de']
+        )
+
+    def test_many_custom_with_default(self):
+        self.assertListEqual(
+            _get_fallback_languages(['tr', 'en', 'de']),
+            ['tr']
+        )
+
+    @override_settings(TRANSLATIONS_FALLBACK_LANGUAGES={
+        'en-gb': ['tr'],
+        'tr': ['de'],
+    })
+    def test_settings_fallbacks(self):
+        self.assertListEqual(
+            _get_fallback_languages('en-gb'),
+            ['en-gb', 'tr', 'de']
+        )
+
+    @override_settings(TRANSLATIONS_FALLBACK_LANGUAGES={
+        'tr': ['de'],
+        'de': ['tr'],
+    })
+    def test_settings_cyclic_fallbacks(self):
+        self.assertListEqual(
+            _get_fallback_languages('tr'),
+            ['tr', 'de']
+        )
+
+    @override_settings(TRANSLATIONS_FALLBACK_LANGUAGES={
+        'en-gb': ['en', 'de'],
+    })
+    def test_settings_fallbacks_with_default(self):
+        self.assertListEqual(
+            _get_fallback_languages('en-gb'),
+            ['en-gb']
+        )
+
+    def test_invalid_custom(self):
+        with self.assertRaises(ValueError) as error:
+            _get_fallback_languages(['de', 'xx'])
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`xx` is not a supported language.'
+        )
+
+
 class GetProbeLanguageTest(TranslationTestCase):
     """Tests for `_get_probe_language`."""
 
@@ -3,6 +3,8 @@ from contextlib import ContextDecorator
 from unittest.mock import patch
 
 from tests.test_case import TranslationTestCase
+from django.test import override_settings
+from django.core.cache import caches
 from django.core.management import call_command
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.auth.models import User
@@ -13,6 +15,13 @@ from translations.models import Translation
 from sample.models import Continent, Country, City
 from sample.utils import create_samples
 
+import tests.storage_models
+
+
+# the tests have no landmarks before Django 3.1
+LANDMARK_CONTENT_TYPES = [('tests', 'landmark')] \
+    if hasattr(tests.storage_models, 'Landmark') else []
+
 
 class PsudeoTTY:
     def isatty(self):
@@ -100,6 +109,7 @@ class CommandTest(TranslationTestCase):
                 ('sample', 'country'),
                 ('sample', 'timezone'),
                 ('sessions', 'session'),
+                *LANDMARK_CONTENT_TYPES,
                 ('translations', 'translation'),
             ]
         )
@@ -3038,3 +3048,30 @@ class CommandTest(TranslationTestCase):
             "If you are sure about synchronization you can run "
             "it with the '--no-input' flag.\n"
         )
+
+    @patch(
+        'translations.management.commands.synctranslations.Command.execute',
+        new=override_execute_with_tty
+    )
+    @patch('builtins.input', new=lambda *args: 'y')
+    @override_tmeta(Continent, fields=['name'])
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_handle_bumps_cache(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+        cache = caches['default']
+        cache.clear()
+        content_type = ContentType.objects.get_for_model(Continent)
+        key = 'translations:generation:{}:de'.format(content_type.id)
+        cache.set(key, 5)
+
+        call_command(
+            'synctranslations',
+            'sample',
+            stdout=StringIO()
+        )
+
+        self.assertEqual(cache.get(key), 6)
@@ -0,0 +1,143 @@
+import asyncio
+
+from tests.test_case import TranslationTestCase
+from django.test import override_settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.http import HttpResponse
+
+from translations.middleware import memo_middleware
+from translations.utils import _translations_memo
+from translations.context import Context
+from translations.models import Translation
+
+from sample.models import Continent
+from sample.utils import create_samples
+
+
+def _read(code, lang):
+    continent = Continent.objects.get(code=code)
+    with Context(continent) as context:
+        context.read(lang)
+    return continent
+
+
+class MemoMiddlewareTest(TranslationTestCase):
+    """Tests for `memo_middleware`."""
+
+    def test_sync(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        captured = []
+
+        def get_response(request):
+            _read('EU', 'de')
+            with CaptureQueriesContext(connection) as queries:
+                europe = Continent.objects.get(code='EU')
+                with Context(europe) as context:
+                    context.read('de')
+            captured.append((europe.name, len(queries)))
+            return HttpResponse()
+
+        memo_middleware(get_response)(None)
+
+        # only the query of the continent itself
+        self.assertListEqual(captured, [('Europa', 1)])
+        self.assertIsNone(_translations_memo.get())
+
+    def test_sync_first_read_num_queries(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        captured = []
+
+        def get_response(request):
+            europe = Continent.objects.get(code='EU')
+            with CaptureQueriesContext(connection) as queries:
+                with Context(europe) as context:
+                    context.read('de')
+            captured.append((europe.name, len(queries)))
+            return HttpResponse()
+
+        memo_middleware(get_response)(None)
+
+        # only the translations, the memo builds no presences
+        self.assertListEqual(captured, [('Europa', 1)])
+
+    def test_sync_requests_separated(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        memos = []
+
+        def get_response(request):
+            memos.append(_translations_memo.get())
+            return HttpResponse()
+
+        middleware = memo_middleware(get_response)
+        middleware(None)
+        middleware(None)
+
+        self.assertIsNot(memos[0], memos[1])
+
+    def test_async(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        memos = []
+
+        async def get_response(request):
+            memos.append(_translations_memo.get())
+            await asyncio.sleep(0)
+            memos.append(_translations_memo.get())
+            return HttpResponse()
+
+        middleware = memo_middleware(get_response)
+
+        async def serve():
+            await asyncio.gather(middleware(None), middleware(None))
+
+        asyncio.run(serve())
+
+        self.assertTrue(asyncio.iscoroutinefunction(middleware))
+        self.assertEqual(len({id(memo) for memo in memos}), 2)
+        self.assertIsNone(_translations_memo.get())
+
+    @override_settings(
+        MIDDLEWARE=['translations.middleware.memo_middleware'],
+    )
+    def test_save_memo_cleared(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        names = []
+
+        def get_response(request):
+            names.append(_read('EU', 'de').name)
+            translation = Translation.objects.get(
+                language='de', field='name', object_id='EU'
+            )
+            translation.text = 'Europa Text'
+            translation.save()
+            names.append(_read('EU', 'de').name)
+            return HttpResponse()
+
+        memo_middleware(get_response)(None)
+
+        self.assertListEqual(names, ['Europa', 'Europa Text'])
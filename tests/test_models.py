@@ -1,8 +1,10 @@
 from tests.test_case import TranslationTestCase
+from django.test import override_settings
 from django.contrib.contenttypes.models import ContentType
-from django.db import utils
+from django.db import connection, models, utils
 
-from translations.models import Translation
+from translations.models import Translation, _get_object_id_field, \
+    _TranslatableFieldDescriptor
 
 from sample.models import Timezone, Continent, City
 from sample.utils import create_samples
@@ -119,6 +121,40 @@ class TranslationTest(TranslationTestCase):
                 text='Europa'
             )
 
+    def test_indexes(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor,
+                Translation._meta.db_table,
+            )
+
+        self.assertListEqual(
+            constraints['translations_read_idx']['columns'],
+            ['content_type_id', 'language', 'object_id']
+        )
+        if connection.vendor in ('mysql', 'sqlite'):
+            # the text index serves the filters on its own
+            self.assertIn('translations_text_idx', constraints)
+            self.assertNotIn('translations_filter_idx', constraints)
+        else:
+            self.assertListEqual(
+                constraints['translations_filter_idx']['columns'],
+                ['content_type_id', 'field', 'language']
+            )
+
+    def test_get_object_id_field(self):
+        field = _get_object_id_field()
+
+        self.assertIsInstance(field, models.CharField)
+        self.assertEqual(field.max_length, 128)
+
+    @override_settings(TRANSLATIONS_INTEGER_OBJECT_ID=True)
+    def test_get_object_id_field_integer(self):
+        self.assertIsInstance(
+            _get_object_id_field(),
+            models.BigIntegerField,
+        )
+
 
 class TranslatableTest(TranslationTestCase):
     """Tests for `Translatable`."""
@@ -168,6 +204,102 @@ class TranslatableTest(TranslationTestCase):
             transform=repr
         )
 
+    def test_setattr_untracked(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        europe.name = 'Europe Name'
+
+        self.assertFalse(hasattr(europe, '_translatable_snapshot'))
+
+    def test_setattr_tracked(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        europe._translatable_snapshot = None
+        europe.name = 'Europe Name'
+        europe.name = 'Europe Other Name'
+        europe.code = 'EU'
+
+        self.assertDictEqual(
+            europe._get_default_translatable_fields(),
+            {'name': 'Europe'}
+        )
+        self.assertListEqual(
+            europe._get_dirty_translatable_fields(),
+            ['name']
+        )
+
+    def test_translatable_fields_descriptors(self):
+        self.assertIsInstance(
+            Continent.__dict__['name'],
+            _TranslatableFieldDescriptor
+        )
+        self.assertIsInstance(
+            Continent.__dict__['denonym'],
+            _TranslatableFieldDescriptor
+        )
+        self.assertNotIsInstance(
+            Continent.__dict__['code'],
+            _TranslatableFieldDescriptor
+        )
+
+    def test_deferred_translatable_field(self):
+        create_samples(
+            continent_names=['europe'],
+        )
+
+        europe = Continent.objects.only('code').get(code='EU')
+
+        self.assertEqual(europe.name, 'Europe')
+
+    def test_set_translated_field(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        europe._translatable_snapshot = None
+        europe.name = 'Europe Name'
+        europe._set_translated_field('name', 'Europa')
+        europe._set_translated_field('denonym', 'Europäisch')
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+        self.assertDictEqual(
+            europe._get_default_translatable_fields(),
+            {'name': 'Europe', 'denonym': 'European'}
+        )
+        self.assertListEqual(europe._get_dirty_translatable_fields(), [])
+
+    def test_reset_translated_field(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        europe._translatable_snapshot = None
+        europe.name = 'Europe Name'
+        europe._reset_translated_field('name')
+        europe._reset_translated_field('denonym')
+
+        self.assertEqual(europe.name, 'Europe')
+        self.assertEqual(europe.denonym, 'European')
+        self.assertDictEqual(europe._get_default_translatable_fields(), {})
+        self.assertListEqual(europe._get_dirty_translatable_fields(), [])
+
     def test_get_translatable_fields_automatic(self):
         self.assertListEqual(
             City.get_translatable_fields(),
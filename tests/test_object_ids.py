@@ -0,0 +1,168 @@
+from tests.test_case import TranslationTestCase
+from django.test import override_settings
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from translations.context import Context
+from translations.models import Translation
+
+from sample.models import City
+from sample.utils import create_samples
+
+
+# these tests only use the models with integer primary keys, so they run
+# with the object ids stored as strings or as integers (which is set by
+# the ``TRANSLATIONS_INTEGER_OBJECT_ID`` setting)
+
+
+class ObjectIdsContextTest(TranslationTestCase):
+    """Tests for `Context` with the object ids of either type."""
+
+    def test_read(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        cities = list(City.objects.order_by('name'))
+        with Context(cities) as context:
+            context.read('de')
+
+        self.assertListEqual(
+            [city.name for city in cities],
+            ['Köln', 'München']
+        )
+
+    def test_create_update_delete(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+        )
+
+        cologne = City.objects.get(name='Cologne')
+        with Context(cologne) as context:
+            cologne.name = 'Köln'
+            context.create('de')
+            cologne.name = 'Köln Text'
+            context.update('de')
+            context.reset()
+            context.read('de')
+            self.assertEqual(cologne.name, 'Köln Text')
+            context.delete('de')
+
+        self.assertFalse(Translation.objects.exists())
+
+
+class ObjectIdsQuerySetTest(TranslationTestCase):
+    """Tests for `TranslatableQuerySet` with the object ids of either type."""
+
+    def setUp(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+    def test_probe_filter(self):
+        cities = City.objects.probe('de').filter(name='München')
+
+        self.assertListEqual(
+            [city.name for city in cities],
+            ['Munich']
+        )
+
+    def test_order_by_translated(self):
+        cities = City.objects.translate('tr').order_by('-name')
+
+        self.assertListEqual(
+            [city.name for city in cities],
+            ['Münih', 'Koln']
+        )
+
+    def test_translate_inline(self):
+        cities = City.objects.translate('de', inline=True).order_by('id')
+
+        with self.assertNumQueries(1):
+            self.assertListEqual(
+                [city.name for city in cities],
+                ['Köln', 'München']
+            )
+
+    def test_translate_values(self):
+        cities = City.objects.translate('de').order_by('id').values('name')
+
+        self.assertListEqual(
+            list(cities),
+            [{'name': 'Köln'}, {'name': 'München'}]
+        )
+
+
+@override_settings(TRANSLATIONS_CACHE='default')
+class ObjectIdsCacheTest(TranslationTestCase):
+    """Tests for the translations cache with the object ids of either type."""
+
+    def setUp(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne', 'munich'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        caches['default'].clear()
+
+    def test_read_cached(self):
+        cities = list(City.objects.order_by('id'))
+        with Context(cities) as context:
+            context.read('de')
+        cities = list(City.objects.order_by('id'))
+        with Context(cities) as context:
+            with CaptureQueriesContext(connection) as captured:
+                context.read('de')
+
+        self.assertEqual(len(captured), 0)
+        self.assertListEqual(
+            [city.name for city in cities],
+            ['Köln', 'München']
+        )
+
+    def test_save_cleared(self):
+        cologne = City.objects.get(name='Cologne')
+        with Context(cologne) as context:
+            context.read('de')
+        translation = Translation.objects.get(
+            language='de', field='name', object_id=cologne.id
+        )
+        translation.text = 'Köln Text'
+        translation.save()
+
+        cologne = City.objects.get(name='Cologne')
+        with Context(cologne) as context:
+            context.read('de')
+
+        self.assertEqual(cologne.name, 'Köln Text')
+
+    def test_create_cleared(self):
+        cologne = City.objects.get(name='Cologne')
+        with Context(cologne) as context:
+            context.read('tr')
+        Translation.objects.create(
+            content_type=cologne.translations.content_type,
+            object_id=cologne.id,
+            field='name',
+            language='tr',
+            text='Koln',
+        )
+
+        cologne = City.objects.get(name='Cologne')
+        with Context(cologne) as context:
+            context.read('tr')
+
+        self.assertEqual(cologne.name, 'Koln')
@@ -1,17 +1,42 @@
 import copy
+from unittest.mock import patch
 
 from tests.test_case import TranslationTestCase
-from django.db.models import Q
+from django.conf import settings
+from django.db.models import Q, QuerySet
 from django.utils.translation import override
 
-from translations.query import _fetch_translations_query_getter, TQ
+from translations.query import _fetch_translations_query_getter, \
+    _TranslationsExists, _get_query_plan, _clear_query_plans, TQ
 
-from sample.models import Continent
+from sample.models import Continent, Country, City
 
 
 class FetchTranslationsQueryGetterTest(TranslationTestCase):
     """Tests for `_fetch_translations_query_getter`."""
 
+    def assertChildrenEqual(self, children, expected):
+        """Assert the children of a query, with their subqueries unwrapped."""
+        self.assertListEqual(
+            [self.get_unwrapped(child) for child in children],
+            expected
+        )
+
+    @staticmethod
+    def get_unwrapped(child):
+        """Return a child of a query, with its subquery unwrapped."""
+        if not isinstance(child, tuple) or \
+                not isinstance(child[1], QuerySet):
+            return child
+        query = child[1].query
+        if '_translations_exists' in query.annotations:
+            # the subqueries are filtered as annotations before Django 3.0
+            exists = query.annotations['_translations_exists']
+            return exists if child[0] == 'pk__in' else (child[0], exists)
+        # the subqueries are not wrapped in lookups in Django 3.0
+        condition = query.where.children[0]
+        return (child[0], getattr(condition, 'lhs', condition))
+
     def test_lookup_nrel_yfield_ntrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
@@ -27,14 +52,12 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_nrel_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 name='Europa'
             ).children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language', 'de'),
-                ('translations__text', 'Europa'),
+                _TranslationsExists(Continent, 'name', 'de', 'Europa'),
             ]
         )
 
@@ -53,14 +76,17 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_nrel_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 name__icontains='Europa'
             ).children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language', 'de'),
-                ('translations__text__icontains', 'Europa'),
+                _TranslationsExists(
+                    Continent,
+                    'name__icontains',
+                    'de',
+                    'Europa',
+                ),
             ]
         )
 
@@ -103,14 +129,15 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_yrel_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 countries__name='Deutschland'
             ).children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language', 'de'),
-                ('countries__translations__text', 'Deutschland'),
+                (
+                    'countries__in',
+                    _TranslationsExists(Country, 'name', 'de', 'Deutschland'),
+                ),
             ]
         )
 
@@ -129,14 +156,20 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_yrel_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 countries__name__icontains='Deutsch'
             ).children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language', 'de'),
-                ('countries__translations__text__icontains', 'Deutsch'),
+                (
+                    'countries__in',
+                    _TranslationsExists(
+                        Country,
+                        'name__icontains',
+                        'de',
+                        'Deutsch',
+                    ),
+                ),
             ]
         )
 
@@ -155,14 +188,15 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_yrelnested_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 countries__cities__name='Köln'
             ).children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                ('countries__cities__translations__language', 'de'),
-                ('countries__cities__translations__text', 'Köln'),
+                (
+                    'countries__cities__in',
+                    _TranslationsExists(City, 'name', 'de', 'Köln'),
+                ),
             ]
         )
 
@@ -181,14 +215,15 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_yrelnested_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 countries__cities__name__icontains='Kö'
             ).children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                ('countries__cities__translations__language', 'de'),
-                ('countries__cities__translations__text__icontains', 'Kö'),
+                (
+                    'countries__cities__in',
+                    _TranslationsExists(City, 'name__icontains', 'de', 'Kö'),
+                ),
             ]
         )
 
@@ -375,14 +410,12 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_nrel_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 name='Europa'
             ).children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language__in', ['de', 'tr']),
-                ('translations__text', 'Europa'),
+                _TranslationsExists(Continent, 'name', ['de', 'tr'], 'Europa'),
             ]
         )
 
@@ -401,14 +434,17 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_nrel_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 name__icontains='Europa'
             ).children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language__in', ['de', 'tr']),
-                ('translations__text__icontains', 'Europa'),
+                _TranslationsExists(
+                    Continent,
+                    'name__icontains',
+                    ['de', 'tr'],
+                    'Europa',
+                ),
             ]
         )
 
@@ -451,14 +487,20 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_yrel_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 countries__name='Deutschland'
             ).children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language__in', ['de', 'tr']),
-                ('countries__translations__text', 'Deutschland'),
+                (
+                    'countries__in',
+                    _TranslationsExists(
+                        Country,
+                        'name',
+                        ['de', 'tr'],
+                        'Deutschland',
+                    ),
+                ),
             ]
         )
 
@@ -477,14 +519,20 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_yrel_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 countries__name__icontains='Deutsch'
             ).children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language__in', ['de', 'tr']),
-                ('countries__translations__text__icontains', 'Deutsch'),
+                (
+                    'countries__in',
+                    _TranslationsExists(
+                        Country,
+                        'name__icontains',
+                        ['de', 'tr'],
+                        'Deutsch',
+                    ),
+                ),
             ]
         )
 
@@ -503,17 +551,15 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_yrelnested_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 countries__cities__name='Köln'
             ).children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
                 (
-                    'countries__cities__translations__language__in',
-                    ['de', 'tr']
+                    'countries__cities__in',
+                    _TranslationsExists(City, 'name', ['de', 'tr'], 'Köln'),
                 ),
-                ('countries__cities__translations__text', 'Köln'),
             ]
         )
 
@@ -532,17 +578,20 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_yrelnested_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 countries__cities__name__icontains='Kö'
             ).children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
                 (
-                    'countries__cities__translations__language__in',
-                    ['de', 'tr']
+                    'countries__cities__in',
+                    _TranslationsExists(
+                        City,
+                        'name__icontains',
+                        ['de', 'tr'],
+                        'Kö',
+                    ),
                 ),
-                ('countries__cities__translations__text__icontains', 'Kö'),
             ]
         )
 
@@ -561,17 +610,13 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_nrel_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 name='Europa'
             ).children[0].children,
             [
                 ('name', 'Europa'),
-                Q(
-                    ('translations__field', 'name'),
-                    ('translations__language__in', ['de']),
-                    ('translations__text', 'Europa'),
-                ),
+                _TranslationsExists(Continent, 'name', ['de'], 'Europa'),
             ]
         )
 
@@ -590,16 +635,17 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_nrel_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 name__icontains='Europa'
             ).children[0].children,
             [
                 ('name__icontains', 'Europa'),
-                Q(
-                    ('translations__field', 'name'),
-                    ('translations__language__in', ['de']),
-                    ('translations__text__icontains', 'Europa'),
+                _TranslationsExists(
+                    Continent,
+                    'name__icontains',
+                    ['de'],
+                    'Europa',
                 ),
             ]
         )
@@ -643,16 +689,20 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_yrel_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 countries__name='Deutschland'
             ).children[0].children,
             [
                 ('countries__name', 'Deutschland'),
-                Q(
-                    ('countries__translations__field', 'name'),
-                    ('countries__translations__language__in', ['de']),
-                    ('countries__translations__text', 'Deutschland'),
+                (
+                    'countries__in',
+                    _TranslationsExists(
+                        Country,
+                        'name',
+                        ['de'],
+                        'Deutschland',
+                    ),
                 ),
             ]
         )
@@ -672,16 +722,20 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_yrel_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 countries__name__icontains='Deutsch'
             ).children[0].children,
             [
                 ('countries__name__icontains', 'Deutsch'),
-                Q(
-                    ('countries__translations__field', 'name'),
-                    ('countries__translations__language__in', ['de']),
-                    ('countries__translations__text__icontains', 'Deutsch'),
+                (
+                    'countries__in',
+                    _TranslationsExists(
+                        Country,
+                        'name__icontains',
+                        ['de'],
+                        'Deutsch',
+                    ),
                 ),
             ]
         )
@@ -701,16 +755,15 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_yrelnested_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 countries__cities__name='Köln'
             ).children[0].children,
             [
                 ('countries__cities__name', 'Köln'),
-                Q(
-                    ('countries__cities__translations__field', 'name'),
-                    ('countries__cities__translations__language__in', ['de']),
-                    ('countries__cities__translations__text', 'Köln'),
+                (
+                    'countries__cities__in',
+                    _TranslationsExists(City, 'name', ['de'], 'Köln'),
                 ),
             ]
         )
@@ -730,16 +783,15 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_lookup_yrelnested_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 countries__cities__name__icontains='Kö'
             ).children[0].children,
             [
                 ('countries__cities__name__icontains', 'Kö'),
-                Q(
-                    ('countries__cities__translations__field', 'name'),
-                    ('countries__cities__translations__language__in', ['de']),
-                    ('countries__cities__translations__text__icontains', 'Kö'),
+                (
+                    'countries__cities__in',
+                    _TranslationsExists(City, 'name__icontains', ['de'], 'Kö'),
                 ),
             ]
         )
@@ -761,16 +813,14 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_nrel_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     name='Europa'
                 )
             ).children[0].children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language', 'de'),
-                ('translations__text', 'Europa'),
+                _TranslationsExists(Continent, 'name', 'de', 'Europa'),
             ]
         )
 
@@ -791,16 +841,19 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_nrel_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     name__icontains='Europa'
                 )
             ).children[0].children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language', 'de'),
-                ('translations__text__icontains', 'Europa'),
+                _TranslationsExists(
+                    Continent,
+                    'name__icontains',
+                    'de',
+                    'Europa',
+                ),
             ]
         )
 
@@ -849,16 +902,17 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_yrel_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     countries__name='Deutschland'
                 )
             ).children[0].children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language', 'de'),
-                ('countries__translations__text', 'Deutschland'),
+                (
+                    'countries__in',
+                    _TranslationsExists(Country, 'name', 'de', 'Deutschland'),
+                ),
             ]
         )
 
@@ -879,16 +933,22 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_yrel_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     countries__name__icontains='Deutsch'
                 )
             ).children[0].children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language', 'de'),
-                ('countries__translations__text__icontains', 'Deutsch'),
+                (
+                    'countries__in',
+                    _TranslationsExists(
+                        Country,
+                        'name__icontains',
+                        'de',
+                        'Deutsch',
+                    ),
+                ),
             ]
         )
 
@@ -909,16 +969,17 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_yrelnested_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     countries__cities__name='Köln'
                 )
             ).children[0].children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                ('countries__cities__translations__language', 'de'),
-                ('countries__cities__translations__text', 'Köln'),
+                (
+                    'countries__cities__in',
+                    _TranslationsExists(City, 'name', 'de', 'Köln'),
+                ),
             ]
         )
 
@@ -939,16 +1000,17 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_yrelnested_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     countries__cities__name__icontains='Kö'
                 )
             ).children[0].children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                ('countries__cities__translations__language', 'de'),
-                ('countries__cities__translations__text__icontains', 'Kö'),
+                (
+                    'countries__cities__in',
+                    _TranslationsExists(City, 'name__icontains', 'de', 'Kö'),
+                ),
             ]
         )
 
@@ -1165,16 +1227,14 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_nrel_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     name='Europa'
                 )
             ).children[0].children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language__in', ['de', 'tr']),
-                ('translations__text', 'Europa'),
+                _TranslationsExists(Continent, 'name', ['de', 'tr'], 'Europa'),
             ]
         )
 
@@ -1195,16 +1255,19 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_nrel_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     name__icontains='Europa'
                 )
             ).children[0].children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language__in', ['de', 'tr']),
-                ('translations__text__icontains', 'Europa'),
+                _TranslationsExists(
+                    Continent,
+                    'name__icontains',
+                    ['de', 'tr'],
+                    'Europa',
+                ),
             ]
         )
 
@@ -1253,16 +1316,22 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_yrel_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     countries__name='Deutschland'
                 )
             ).children[0].children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language__in', ['de', 'tr']),
-                ('countries__translations__text', 'Deutschland'),
+                (
+                    'countries__in',
+                    _TranslationsExists(
+                        Country,
+                        'name',
+                        ['de', 'tr'],
+                        'Deutschland',
+                    ),
+                ),
             ]
         )
 
@@ -1283,16 +1352,22 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_yrel_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     countries__name__icontains='Deutsch'
                 )
             ).children[0].children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language__in', ['de', 'tr']),
-                ('countries__translations__text__icontains', 'Deutsch'),
+                (
+                    'countries__in',
+                    _TranslationsExists(
+                        Country,
+                        'name__icontains',
+                        ['de', 'tr'],
+                        'Deutsch',
+                    ),
+                ),
             ]
         )
 
@@ -1313,19 +1388,17 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_yrelnested_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     countries__cities__name='Köln'
                 )
             ).children[0].children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
                 (
-                    'countries__cities__translations__language__in',
-                    ['de', 'tr']
+                    'countries__cities__in',
+                    _TranslationsExists(City, 'name', ['de', 'tr'], 'Köln'),
                 ),
-                ('countries__cities__translations__text', 'Köln'),
             ]
         )
 
@@ -1346,19 +1419,22 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_yrelnested_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     countries__cities__name__icontains='Kö'
                 )
             ).children[0].children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
                 (
-                    'countries__cities__translations__language__in',
-                    ['de', 'tr']
+                    'countries__cities__in',
+                    _TranslationsExists(
+                        City,
+                        'name__icontains',
+                        ['de', 'tr'],
+                        'Kö',
+                    ),
                 ),
-                ('countries__cities__translations__text__icontains', 'Kö'),
             ]
         )
 
@@ -1379,7 +1455,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_nrel_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     name='Europa'
@@ -1387,11 +1463,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
             ).children[0].children[0].children,
             [
                 ('name', 'Europa'),
-                Q(
-                    ('translations__field', 'name'),
-                    ('translations__language__in', ['de']),
-                    ('translations__text', 'Europa'),
-                ),
+                _TranslationsExists(Continent, 'name', ['de'], 'Europa'),
             ]
         )
 
@@ -1412,7 +1484,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_nrel_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     name__icontains='Europa'
@@ -1420,10 +1492,11 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
             ).children[0].children[0].children,
             [
                 ('name__icontains', 'Europa'),
-                Q(
-                    ('translations__field', 'name'),
-                    ('translations__language__in', ['de']),
-                    ('translations__text__icontains', 'Europa'),
+                _TranslationsExists(
+                    Continent,
+                    'name__icontains',
+                    ['de'],
+                    'Europa',
                 ),
             ]
         )
@@ -1473,7 +1546,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_yrel_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     countries__name='Deutschland'
@@ -1481,10 +1554,14 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
             ).children[0].children[0].children,
             [
                 ('countries__name', 'Deutschland'),
-                Q(
-                    ('countries__translations__field', 'name'),
-                    ('countries__translations__language__in', ['de']),
-                    ('countries__translations__text', 'Deutschland'),
+                (
+                    'countries__in',
+                    _TranslationsExists(
+                        Country,
+                        'name',
+                        ['de'],
+                        'Deutschland',
+                    ),
                 ),
             ]
         )
@@ -1506,7 +1583,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_yrel_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     countries__name__icontains='Deutsch'
@@ -1514,11 +1591,15 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
             ).children[0].children[0].children,
             [
                 ('countries__name__icontains', 'Deutsch'),
-                Q(
-                    ('countries__translations__field', 'name'),
-                    ('countries__translations__language__in', ['de']),
-                    ('countries__translations__text__icontains', 'Deutsch'),
-                )
+                (
+                    'countries__in',
+                    _TranslationsExists(
+                        Country,
+                        'name__icontains',
+                        ['de'],
+                        'Deutsch',
+                    ),
+                ),
             ]
         )
 
@@ -1539,7 +1620,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_yrelnested_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     countries__cities__name='Köln'
@@ -1547,11 +1628,10 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
             ).children[0].children[0].children,
             [
                 ('countries__cities__name', 'Köln'),
-                Q(
-                    ('countries__cities__translations__field', 'name'),
-                    ('countries__cities__translations__language__in', ['de']),
-                    ('countries__cities__translations__text', 'Köln'),
-                )
+                (
+                    'countries__cities__in',
+                    _TranslationsExists(City, 'name', ['de'], 'Köln'),
+                ),
             ]
         )
 
@@ -1572,7 +1652,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_q_yrelnested_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 Q(
                     countries__cities__name__icontains='Kö'
@@ -1580,11 +1660,10 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
             ).children[0].children[0].children,
             [
                 ('countries__cities__name__icontains', 'Kö'),
-                Q(
-                    ('countries__cities__translations__field', 'name'),
-                    ('countries__cities__translations__language__in', ['de']),
-                    ('countries__cities__translations__text__icontains', 'Kö'),
-                )
+                (
+                    'countries__cities__in',
+                    _TranslationsExists(City, 'name__icontains', ['de'], 'Kö'),
+                ),
             ]
         )
 
@@ -1607,7 +1686,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_nrel_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     name='Europa',
@@ -1616,9 +1695,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language', 'de'),
-                ('translations__text', 'Europa'),
+                _TranslationsExists(Continent, 'name', 'de', 'Europa'),
             ]
         )
 
@@ -1641,7 +1718,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_nrel_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     name__icontains='Europa',
@@ -1650,9 +1727,12 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language', 'de'),
-                ('translations__text__icontains', 'Europa'),
+                _TranslationsExists(
+                    Continent,
+                    'name__icontains',
+                    'de',
+                    'Europa',
+                ),
             ]
         )
 
@@ -1707,7 +1787,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_yrel_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     countries__name='Deutschland',
@@ -1716,9 +1796,10 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language', 'de'),
-                ('countries__translations__text', 'Deutschland'),
+                (
+                    'countries__in',
+                    _TranslationsExists(Country, 'name', 'de', 'Deutschland'),
+                ),
             ]
         )
 
@@ -1741,7 +1822,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_yrel_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     countries__name__icontains='Deutsch',
@@ -1750,9 +1831,15 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language', 'de'),
-                ('countries__translations__text__icontains', 'Deutsch'),
+                (
+                    'countries__in',
+                    _TranslationsExists(
+                        Country,
+                        'name__icontains',
+                        'de',
+                        'Deutsch',
+                    ),
+                ),
             ]
         )
 
@@ -1775,7 +1862,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_yrelnested_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     countries__cities__name='Köln',
@@ -1784,9 +1871,10 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                ('countries__cities__translations__language', 'de'),
-                ('countries__cities__translations__text', 'Köln'),
+                (
+                    'countries__cities__in',
+                    _TranslationsExists(City, 'name', 'de', 'Köln'),
+                ),
             ]
         )
 
@@ -1809,7 +1897,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_yrelnested_yfield_ytrans_ysupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     countries__cities__name__icontains='Kö',
@@ -1818,9 +1906,10 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
-                ('countries__cities__translations__language', 'de'),
-                ('countries__cities__translations__text__icontains', 'Kö'),
+                (
+                    'countries__cities__in',
+                    _TranslationsExists(City, 'name__icontains', 'de', 'Kö'),
+                ),
             ]
         )
 
@@ -2067,7 +2156,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_nrel_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     name='Europa',
@@ -2076,9 +2165,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language__in', ['de', 'tr']),
-                ('translations__text', 'Europa'),
+                _TranslationsExists(Continent, 'name', ['de', 'tr'], 'Europa'),
             ]
         )
 
@@ -2101,7 +2188,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_nrel_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     name__icontains='Europa',
@@ -2110,9 +2197,12 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('translations__field', 'name'),
-                ('translations__language__in', ['de', 'tr']),
-                ('translations__text__icontains', 'Europa'),
+                _TranslationsExists(
+                    Continent,
+                    'name__icontains',
+                    ['de', 'tr'],
+                    'Europa',
+                ),
             ]
         )
 
@@ -2167,7 +2257,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_yrel_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     countries__name='Deutschland',
@@ -2176,9 +2266,15 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language__in', ['de', 'tr']),
-                ('countries__translations__text', 'Deutschland'),
+                (
+                    'countries__in',
+                    _TranslationsExists(
+                        Country,
+                        'name',
+                        ['de', 'tr'],
+                        'Deutschland',
+                    ),
+                ),
             ]
         )
 
@@ -2201,7 +2297,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_yrel_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     countries__name__icontains='Deutsch',
@@ -2210,9 +2306,15 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('countries__translations__field', 'name'),
-                ('countries__translations__language__in', ['de', 'tr']),
-                ('countries__translations__text__icontains', 'Deutsch'),
+                (
+                    'countries__in',
+                    _TranslationsExists(
+                        Country,
+                        'name__icontains',
+                        ['de', 'tr'],
+                        'Deutsch',
+                    ),
+                ),
             ]
         )
 
@@ -2235,7 +2337,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_yrelnested_yfield_ytrans_nsupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     countries__cities__name='Köln',
@@ -2244,12 +2346,10 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
                 (
-                    'countries__cities__translations__language__in',
-                    ['de', 'tr']
+                    'countries__cities__in',
+                    _TranslationsExists(City, 'name', ['de', 'tr'], 'Köln'),
                 ),
-                ('countries__cities__translations__text', 'Köln'),
             ]
         )
 
@@ -2272,7 +2372,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_yrelnested_yfield_ytrans_ysupp_listlang(self):
         getter = _fetch_translations_query_getter(Continent, ['de', 'tr'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     countries__cities__name__icontains='Kö',
@@ -2281,12 +2381,15 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
                 )
             ).children[0].children[0].children,
             [
-                ('countries__cities__translations__field', 'name'),
                 (
-                    'countries__cities__translations__language__in',
-                    ['de', 'tr']
+                    'countries__cities__in',
+                    _TranslationsExists(
+                        City,
+                        'name__icontains',
+                        ['de', 'tr'],
+                        'Kö',
+                    ),
                 ),
-                ('countries__cities__translations__text__icontains', 'Kö'),
             ]
         )
 
@@ -2309,7 +2412,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_nrel_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     name='Europa',
@@ -2319,11 +2422,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
             ).children[0].children[0].children,
             [
                 ('name', 'Europa'),
-                Q(
-                    ('translations__field', 'name'),
-                    ('translations__language__in', ['de']),
-                    ('translations__text', 'Europa'),
-                ),
+                _TranslationsExists(Continent, 'name', ['de'], 'Europa'),
             ]
         )
 
@@ -2346,7 +2445,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_nrel_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     name__icontains='Europa',
@@ -2356,10 +2455,11 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
             ).children[0].children[0].children,
             [
                 ('name__icontains', 'Europa'),
-                Q(
-                    ('translations__field', 'name'),
-                    ('translations__language__in', ['de']),
-                    ('translations__text__icontains', 'Europa'),
+                _TranslationsExists(
+                    Continent,
+                    'name__icontains',
+                    ['de'],
+                    'Europa',
                 ),
             ]
         )
@@ -2415,7 +2515,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_yrel_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     countries__name='Deutschland',
@@ -2425,10 +2525,14 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
             ).children[0].children[0].children,
             [
                 ('countries__name', 'Deutschland'),
-                Q(
-                    ('countries__translations__field', 'name'),
-                    ('countries__translations__language__in', ['de']),
-                    ('countries__translations__text', 'Deutschland'),
+                (
+                    'countries__in',
+                    _TranslationsExists(
+                        Country,
+                        'name',
+                        ['de'],
+                        'Deutschland',
+                    ),
                 ),
             ]
         )
@@ -2452,7 +2556,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_yrel_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     countries__name__icontains='Deutsch',
@@ -2462,11 +2566,15 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
             ).children[0].children[0].children,
             [
                 ('countries__name__icontains', 'Deutsch'),
-                Q(
-                    ('countries__translations__field', 'name'),
-                    ('countries__translations__language__in', ['de']),
-                    ('countries__translations__text__icontains', 'Deutsch'),
-                )
+                (
+                    'countries__in',
+                    _TranslationsExists(
+                        Country,
+                        'name__icontains',
+                        ['de'],
+                        'Deutsch',
+                    ),
+                ),
             ]
         )
 
@@ -2489,7 +2597,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_yrelnested_yfield_ytrans_nsupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     countries__cities__name='Köln',
@@ -2499,11 +2607,10 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
             ).children[0].children[0].children,
             [
                 ('countries__cities__name', 'Köln'),
-                Q(
-                    ('countries__cities__translations__field', 'name'),
-                    ('countries__cities__translations__language__in', ['de']),
-                    ('countries__cities__translations__text', 'Köln'),
-                )
+                (
+                    'countries__cities__in',
+                    _TranslationsExists(City, 'name', ['de'], 'Köln'),
+                ),
             ]
         )
 
@@ -2526,7 +2633,7 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
     def test_tq_yrelnested_yfield_ytrans_ysupp_listlangdef(self):
         getter = _fetch_translations_query_getter(Continent, ['en', 'de'])
 
-        self.assertListEqual(
+        self.assertChildrenEqual(
             getter(
                 TQ(
                     countries__cities__name__icontains='Kö',
@@ -2536,13 +2643,39 @@ class FetchTranslationsQueryGetterTest(TranslationTestCase):
             ).children[0].children[0].children,
             [
                 ('countries__cities__name__icontains', 'Kö'),
-                Q(
-                    ('countries__cities__translations__field', 'name'),
-                    ('countries__cities__translations__language__in', ['de']),
-                    ('countries__cities__translations__text__icontains', 'Kö'),
-                )
+                (
+                    'countries__cities__in',
+                    _TranslationsExists(City, 'name__icontains', ['de'], 'Kö'),
+                ),
+            ]
+        )
+
+    def test_plan_reused_for_values(self):
+        _clear_query_plans()
+        getter = _fetch_translations_query_getter(Continent, 'de')
+        getter(countries__name__icontains='Deutsch')
+
+        self.assertChildrenEqual(
+            getter(
+                countries__name__icontains='Kor'
+            ).children[0].children,
+            [
+                (
+                    'countries__in',
+                    _TranslationsExists(
+                        Country, 'name__icontains', 'de', 'Kor'
+                    ),
+                ),
             ]
         )
+        self.assertEqual(_get_query_plan.cache_info().hits, 1)
+
+    def test_plans_cleared_on_installed_apps(self):
+        getter = _fetch_translations_query_getter(Continent, 'de')
+        getter(countries__name__icontains='Deutsch')
+
+        with self.settings(INSTALLED_APPS=settings.INSTALLED_APPS):
+            self.assertEqual(_get_query_plan.cache_info().currsize, 0)
 
 
 class TQTest(TranslationTestCase):
@@ -2599,6 +2732,73 @@ class TQTest(TranslationTestCase):
 
         self.assertIs(type(tq_copy), TQ)
 
+    def test_copy_lang(self):
+        tq = TQ()('de')
+        tq_copy = copy.copy(tq)
+
+        self.assertEqual(tq_copy.lang, 'de')
+
+    def test_copy_type(self):
+        tq = TQ()('de')
+        tq_copy = copy.copy(tq)
+
+        self.assertIs(type(tq_copy), TQ)
+
+    def test_call_shares_children(self):
+        tq = TQ(countries__name='Deutschland')
+        tq_de = tq('de')
+
+        self.assertIsNot(tq_de, tq)
+        self.assertIs(tq_de.children, tq.children)
+        self.assertIs(tq.lang, None)
+
+    def test_copy_without_create(self):
+        tq = TQ(countries__name='Deutschland')('de')
+        # `Node.create` is called `Node._new_instance` before Django 4.2
+        create = getattr(Q, 'create', None) or Q._new_instance
+        with patch.object(TQ, 'create', None, create=True), \
+                patch.object(
+                    TQ,
+                    '_new_instance',
+                    classmethod(create.__func__),
+                    create=True,
+                ):
+            tq_copy = copy.copy(tq)
+
+        self.assertIs(type(tq_copy), TQ)
+        self.assertIs(tq_copy.children, tq.children)
+        self.assertEqual(tq_copy.lang, 'de')
+
+    def test_combine_empty_other(self):
+        other = Q(countries__name='Germany')
+        combined = TQ() | other
+
+        self.assertIsNot(combined, other)
+        self.assertIs(type(combined), Q)
+        self.assertIs(combined.children, other.children)
+
+    def test_invert_lang(self):
+        tq = ~TQ(countries__name='Deutschland')('de')
+
+        self.assertIs(type(tq), TQ)
+        self.assertIs(tq.negated, True)
+        self.assertEqual(tq.lang, 'de')
+
+    def test_invert_shares_children(self):
+        tq = TQ(countries__name='Deutschland')('de')
+        inverted = ~tq
+
+        self.assertIs(tq.negated, False)
+        self.assertIs(inverted.children, tq.children)
+
+    def test_combine_shares_children(self):
+        tq = TQ(countries__name='Deutschland')('de')
+        other = Q(countries__name='Germany')
+        combined = tq | other
+
+        self.assertIs(combined.children[0], tq)
+        self.assertIs(combined.children[1], other)
+
     def test_combine_self_and_wrong_type(self):
         tq = TQ()
 
@@ -1,9 +1,22 @@
+from unittest import skipIf, skipUnless
+
+import django
 from django.test import override_settings
 from tests.test_case import TranslationTestCase
+from django.db import connection, NotSupportedError
 from django.db.models import Q
+from django.core.cache import caches
+from django.contrib.contenttypes.models import ContentType
+from django.test.utils import CaptureQueriesContext
 from django.utils.translation import override
+try:
+    from asgiref.sync import sync_to_async
+except ImportError:
+    sync_to_async = None
+
+from translations.models import Translation
 
-from sample.models import Continent
+from sample.models import Continent, Country, City
 from sample.utils import create_samples
 
 
@@ -1361,6 +1374,58 @@ class TranslatableQuerySetTest(TranslationTestCase):
         self.assertEqual(seoul.name, 'Seoul')
         self.assertEqual(seoul.denonym, 'Seouler')
 
+    def test_filter_many_langs_no_duplicates(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        # 'Europa' and 'Avrupa' both match
+        continents = Continent.objects.probe(['de', 'tr']).filter(
+            name__icontains='a'
+        )
+
+        self.assertListEqual(
+            sorted(continent.code for continent in continents),
+            ['AS', 'EU']
+        )
+        self.assertNotIn('JOIN', str(continents.query))
+
+    def test_filter_relation_no_duplicates(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            country_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = Continent.objects.probe(['de', 'tr']).filter(
+            countries__name__icontains='a'
+        )
+
+        self.assertListEqual(
+            [continent.code for continent in continents],
+            ['EU']
+        )
+
+    def test_exclude_relation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            country_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = Continent.objects.probe('de').exclude(
+            countries__name='Deutschland'
+        )
+
+        self.assertListEqual(
+            [continent.code for continent in continents],
+            ['AS']
+        )
+
     @override(language='de', deactivate=True)
     def test_fetch_all_exclude_level_0_relation_no_lang(self):
         create_samples(
@@ -2264,6 +2329,430 @@ class TranslatableQuerySetTest(TranslationTestCase):
 
         self.assertEqual(continents._trans_lang, 'de')
 
+    def test_translate_many_langs(self):
+        continents = Continent.objects.translate(['tr', 'de-at'])
+
+        self.assertEqual(continents._trans_lang, ['tr', 'de'])
+
+    def test_translate_many_langs_evaluation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+        Translation.objects.filter(
+            language='tr',
+            field='denonym',
+        ).delete()
+
+        continents = Continent.objects.translate(['tr', 'de'])
+
+        with self.assertNumQueries(2):
+            europe = [x for x in continents if x.code == 'EU'][0]
+
+        self.assertEqual(europe.name, 'Avrupa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+    def test_translate_fields(self):
+        continents = Continent.objects.translate('de', fields=['name'])
+
+        self.assertEqual(continents._trans_fields, ('name',))
+        self.assertEqual(continents.all()._trans_fields, ('name',))
+
+    def test_translate_fields_evaluation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = Continent.objects.translate('de', fields=['name'])
+        europe = [x for x in continents if x.code == 'EU'][0]
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'European')
+
+    def test_translate_inline(self):
+        continents = Continent.objects.translate('de', inline=True)
+
+        self.assertIs(continents._trans_inline, True)
+        self.assertIs(continents.all()._trans_inline, True)
+        self.assertIs(continents.translate('de')._trans_inline, False)
+
+    def test_translate_inline_evaluation_num_queries(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de', inline=True)
+
+        with self.assertNumQueries(1):
+            europe = [x for x in continents if x.code == 'EU'][0]
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+        self.assertNotIn('_translations_text_name', europe.__dict__)
+
+    def test_translate_inline_union_evaluation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.filter(code='EU').union(
+            Continent.objects.filter(code='AS')
+        ).translate('de', inline=True)
+        names = sorted(x.name for x in continents)
+
+        self.assertListEqual(names, ['Asien', 'Europa'])
+
+    def test_translate_inline_many_langs_evaluation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+        Translation.objects.filter(
+            language='tr',
+            field='denonym',
+        ).delete()
+
+        continents = Continent.objects.translate(['tr', 'de'], inline=True)
+
+        with self.assertNumQueries(1):
+            europe = [x for x in continents if x.code == 'EU'][0]
+
+        self.assertEqual(europe.name, 'Avrupa')
+        self.assertEqual(europe.denonym, 'Europäisch')
+
+    def test_translate_inline_fields_evaluation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate(
+            'de', fields=['name'], inline=True
+        )
+        europe = [x for x in continents if x.code == 'EU'][0]
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(europe.denonym, 'European')
+
+    def test_translate_inline_untranslated_evaluation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name'],
+            langs=['de']
+        )
+        Translation.objects.filter(text='Europa').delete()
+
+        continents = Continent.objects.translate('de', inline=True)
+        europe = [x for x in continents if x.code == 'EU'][0]
+
+        self.assertEqual(europe.name, 'Europe')
+        self.assertEqual(europe.denonym, 'European')
+
+    def test_translate_inline_related_evaluation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            continent_fields=['name'],
+            country_fields=['name'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate(
+            'de', inline=True
+        ).translate_related('countries').prefetch_related('countries')
+
+        with self.assertNumQueries(3):
+            europe = [x for x in continents if x.code == 'EU'][0]
+            germany = europe.countries.all()[0]
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(germany.name, 'Deutschland')
+
+    def test_translate_values_evaluation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').values(
+            'code', 'name'
+        ).order_by('code')
+
+        with self.assertNumQueries(1):
+            self.assertListEqual(
+                list(continents),
+                [
+                    {'code': 'AS', 'name': 'Asien'},
+                    {'code': 'EU', 'name': 'Europa'},
+                ]
+            )
+
+    def test_translate_values_all_evaluation(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        self.assertListEqual(
+            list(Continent.objects.values().translate('de')),
+            [
+                {'name': 'Europa', 'denonym': 'Europäisch', 'code': 'EU'},
+            ]
+        )
+
+    def test_translate_values_list_evaluation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            continent_fields=['name'],
+            country_fields=['name'],
+            langs=['de']
+        )
+
+        countries = Country.objects.translate('de').order_by('code')
+
+        self.assertListEqual(
+            list(countries.values_list('name', 'continent__name', 'code')),
+            [
+                ('Deutschland', 'Europa', 'DE'),
+                ('Südkorea', 'Asien', 'KR'),
+            ]
+        )
+        self.assertListEqual(
+            list(countries.values_list('name', flat=True)),
+            ['Deutschland', 'Südkorea']
+        )
+        self.assertListEqual(
+            [
+                (x.code, x.name)
+                for x in countries.values_list('code', 'name', named=True)
+            ],
+            [
+                ('DE', 'Deutschland'),
+                ('KR', 'Südkorea'),
+            ]
+        )
+
+    def test_translate_values_many_langs_fields_evaluation(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+        Translation.objects.filter(
+            language='tr',
+            field='name',
+        ).delete()
+
+        self.assertListEqual(
+            list(Continent.objects.translate(
+                ['tr', 'de'], fields=['name']
+            ).values_list('name', 'denonym')),
+            [
+                ('Europa', 'European'),
+            ]
+        )
+
+    def test_values_no_lang_evaluation(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name'],
+            langs=['de']
+        )
+
+        self.assertListEqual(
+            list(Continent.objects.values_list('name', flat=True)),
+            ['Europe']
+        )
+
+    def test_iterator_evaluation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').order_by('code')
+
+        with self.assertNumQueries(3):
+            self.assertListEqual(
+                [
+                    (x.name, x.denonym)
+                    for x in continents.iterator(chunk_size=1)
+                ],
+                [
+                    ('Asien', 'Asiatisch'),
+                    ('Europa', 'Europäisch'),
+                ]
+            )
+
+    def test_iterator_relation_evaluation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            continent_fields=['name'],
+            country_fields=['name'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').translate_related(
+            'countries'
+        ).order_by('code')
+
+        self.assertListEqual(
+            [
+                (x.name, [y.name for y in x.countries.all()])
+                for x in continents.iterator(chunk_size=1)
+            ],
+            [
+                ('Asien', ['Südkorea']),
+                ('Europa', ['Deutschland']),
+            ]
+        )
+
+    def test_iterator_inline_evaluation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate(
+            'de', inline=True
+        ).order_by('code')
+
+        with self.assertNumQueries(1):
+            self.assertListEqual(
+                [x.name for x in continents.iterator(chunk_size=1)],
+                ['Asien', 'Europa']
+            )
+
+    def test_iterator_values_evaluation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').order_by('code')
+
+        self.assertListEqual(
+            list(continents.values('name').iterator()),
+            [{'name': 'Asien'}, {'name': 'Europa'}]
+        )
+        self.assertListEqual(
+            list(continents.values_list('name', flat=True).iterator()),
+            ['Asien', 'Europa']
+        )
+
+    def test_iterator_no_lang_evaluation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.order_by('code')
+
+        with self.assertNumQueries(1):
+            self.assertListEqual(
+                [x.name for x in continents.iterator()],
+                ['Asia', 'Europe']
+            )
+
+    @skipUnless(django.VERSION >= (4, 1), 'the async queries need Django 4.1')
+    async def test_aiter_evaluation(self):
+        await sync_to_async(create_samples)(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').order_by('code')
+
+        self.assertListEqual(
+            [x.name async for x in continents],
+            ['Asien', 'Europa']
+        )
+        self.assertEqual(
+            (await continents.aget(code='EU')).name,
+            'Europa'
+        )
+
+    @skipUnless(django.VERSION >= (4, 1), 'the async queries need Django 4.1')
+    async def test_aiterator_evaluation(self):
+        await sync_to_async(create_samples)(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            continent_fields=['name'],
+            country_fields=['name'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').translate_related(
+            'countries'
+        ).order_by('code')
+
+        self.assertListEqual(
+            [x.name async for x in continents.aiterator(chunk_size=1)],
+            ['Asien', 'Europa']
+        )
+        self.assertListEqual(
+            [
+                x async for x in continents.values_list(
+                    'name', flat=True
+                ).aiterator()
+            ],
+            ['Asien', 'Europa']
+        )
+
+    @skipUnless(django.VERSION >= (5, 0), 'prefetching needs Django 5.0')
+    async def test_aiterator_prefetch_related(self):
+        await sync_to_async(create_samples)(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            continent_fields=['name'],
+            country_fields=['name'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.prefetch_related(
+            'countries'
+        ).translate('de').order_by('code')
+        continents = [x async for x in continents.aiterator(chunk_size=1)]
+
+        self.assertListEqual(
+            [x.name for x in continents],
+            ['Asien', 'Europa']
+        )
+        self.assertIn(
+            'countries',
+            continents[0]._prefetched_objects_cache,
+        )
+
+    @skipIf(
+        django.VERSION < (4, 1) or django.VERSION >= (5, 0),
+        'prefetching is not supported before Django 5.0',
+    )
+    async def test_aiterator_prefetch_related_not_supported(self):
+        continents = Continent.objects.prefetch_related(
+            'countries'
+        ).translate('de')
+
+        with self.assertRaises(NotSupportedError):
+            [x async for x in continents.aiterator()]
+
     def test_translate_invalid_lang(self):
         with self.assertRaises(ValueError) as error:
             Continent.objects.translate('xx')
@@ -2307,6 +2796,136 @@ class TranslatableQuerySetTest(TranslationTestCase):
             '`xx` is not a supported language.'
         )
 
+    def test_order_by_translated(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name'],
+            langs=['de']
+        )
+        Translation.objects.filter(
+            language='de',
+            text='Asien',
+        ).update(text='Orient')
+
+        self.assertListEqual(
+            [x.name for x in Continent.objects.order_by('name')],
+            ['Asia', 'Europe']
+        )
+        self.assertListEqual(
+            [x.name for x in Continent.objects.translate('de').order_by(
+                'name'
+            )],
+            ['Europa', 'Orient']
+        )
+        self.assertListEqual(
+            [x.name for x in Continent.objects.translate('de').order_by(
+                '-name'
+            )],
+            ['Orient', 'Europa']
+        )
+
+    def test_order_by_sliced_translate(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea', 'turkey'],
+            country_fields=['name'],
+            langs=['de', 'tr']
+        )
+
+        # the slices are taken in the ordering they were taken in
+        self.assertListEqual(
+            [x.name for x in Country.objects.order_by('name')[:2].translate(
+                'de'
+            )],
+            ['Deutschland', 'Südkorea']
+        )
+        self.assertListEqual(
+            [x.name for x in Country.objects.translate('de').order_by(
+                'name'
+            )[:2].translate('tr')],
+            ['Almanya', 'Güney Kore']
+        )
+
+    def test_order_by_translated_fallback(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name'],
+            langs=['de']
+        )
+        Translation.objects.filter(
+            language='de',
+            text='Asien',
+        ).update(text='Orient')
+        Translation.objects.filter(
+            language='de',
+            text='Europa',
+        ).delete()
+
+        self.assertListEqual(
+            [x.name for x in Continent.objects.translate('de').order_by(
+                'name'
+            )],
+            ['Europe', 'Orient']
+        )
+
+    def test_order_by_translated_before_translate(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name'],
+            langs=['de']
+        )
+        Translation.objects.filter(
+            language='de',
+            text='Asien',
+        ).update(text='Orient')
+
+        self.assertListEqual(
+            [x.name for x in Continent.objects.order_by('name').translate(
+                'de'
+            )],
+            ['Europa', 'Orient']
+        )
+
+    def test_order_by_translated_relation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            city_names=['cologne', 'seoul'],
+            country_fields=['name'],
+            city_fields=['name'],
+            langs=['de']
+        )
+        Translation.objects.filter(
+            language='de',
+            text='Deutschland',
+        ).update(text='Westdeutschland')
+
+        self.assertListEqual(
+            [x.name for x in City.objects.translate('de').order_by(
+                'country__name'
+            )],
+            ['Seül', 'Köln']
+        )
+
+    def test_order_by_translated_slice_num_queries(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name'],
+            langs=['de']
+        )
+        Translation.objects.filter(
+            language='de',
+            text='Asien',
+        ).update(text='Orient')
+
+        continents = Continent.objects.translate('de').order_by('-name')
+
+        with self.assertNumQueries(2):
+            self.assertListEqual(
+                [x.name for x in continents[:1]],
+                ['Orient']
+            )
+
     def test_fetch_latest(self):
         create_samples(
             continent_names=['europe'],
@@ -2322,3 +2941,73 @@ class TranslatableQuerySetTest(TranslationTestCase):
             langs=['de']
         )
         Continent.objects.earliest('pk')
+
+
+class TranslationQuerySetTest(TranslationTestCase):
+    """Tests for `TranslationQuerySet`."""
+
+    def setUp(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+        self.cache = caches['default']
+        self.cache.clear()
+        self.ct_id = ContentType.objects.get_for_model(Continent).id
+        self.keys = [
+            'translations:generation:{}:{}'.format(self.ct_id, lang)
+            for lang in ['en', 'de', 'tr']
+        ]
+        self.cache.set_many({key: 5 for key in self.keys})
+
+    def get_bumped(self):
+        return [self.cache.get(key) > 5 for key in self.keys]
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_bulk_create(self):
+        Translation.objects.bulk_create([
+            Translation(
+                content_type_id=self.ct_id,
+                object_id='AS',
+                field='name',
+                language='tr',
+                text='Asya Text',
+            ),
+        ], ignore_conflicts=True)
+
+        self.assertListEqual(self.get_bumped(), [False, False, True])
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_bulk_update(self):
+        translation = Translation.objects.get(
+            object_id='EU', field='name', language='de'
+        )
+        translation.text = 'Europa Text'
+        Translation.objects.bulk_update([translation], ['text'])
+
+        self.assertListEqual(self.get_bumped(), [False, True, False])
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_update(self):
+        Translation.objects.filter(language='de').update(text='Text')
+
+        self.assertListEqual(self.get_bumped(), [False, True, False])
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_update_language(self):
+        Translation.objects.filter(
+            language='de', field='name'
+        ).delete()
+        Translation.objects.filter(
+            language='tr', field='name'
+        ).update(language='de')
+
+        self.assertListEqual(self.get_bumped(), [True, True, True])
+
+    def test_update_disabled_num_queries(self):
+        with CaptureQueriesContext(connection) as captured:
+            Translation.objects.filter(language='de').update(text='Text')
+
+        self.assertEqual(len(captured), 1)
+        self.assertListEqual(self.get_bumped(), [False, False, False])
@@ -0,0 +1,312 @@
+from unittest import skipIf
+
+from tests.test_case import TranslationTestCase
+from django.db import connection
+from django.contrib.contenttypes.models import ContentType
+from django.test.utils import CaptureQueriesContext
+
+from translations.context import Context
+from translations.models import Translation
+
+from sample.models import City
+from sample.utils import create_samples
+
+try:
+    from tests.storage_models import Landmark
+except ImportError:
+    Landmark = None
+
+
+@skipIf(Landmark is None, 'the storages need the `JSONField` of Django 3.1')
+class JSONStorageTest(TranslationTestCase):
+    """Tests for `JSONStorage`."""
+
+    def setUp(self):
+        create_samples(
+            continent_names=['europe'],
+            country_names=['germany'],
+            city_names=['cologne'],
+            city_fields=['name'],
+            langs=['de'],
+        )
+        self.storage = Landmark._get_translatable_storage()
+        self.landmark = Landmark.objects.create(
+            name='Cathedral',
+            description='A gothic church',
+            city=City.objects.get(name='Cologne'),
+            translations_data={
+                'de': {'name': 'Dom', 'description': 'Eine gotische Kirche'},
+                'tr': {'name': 'Katedral'},
+            },
+        )
+
+    def test_read(self):
+        self.assertListEqual(
+            self.storage.read(1, {'1': self.landmark}, ['de']),
+            [
+                (1, '1', 'name', 'Dom', 'de'),
+                (1, '1', 'description', 'Eine gotische Kirche', 'de'),
+            ]
+        )
+
+    def test_read_fields(self):
+        self.assertListEqual(
+            self.storage.read(
+                1, {'1': self.landmark}, ['de', 'tr'], ['name']
+            ),
+            [
+                (1, '1', 'name', 'Dom', 'de'),
+                (1, '1', 'name', 'Katedral', 'tr'),
+            ]
+        )
+
+    def test_write(self):
+        counts = self.storage.write(
+            {'1': self.landmark},
+            'tr',
+            [('1', 'name', 'Katedral'), ('1', 'description', 'Bir kilise')],
+            [],
+        )
+
+        self.assertDictEqual(
+            counts,
+            {'created': 1, 'updated': 0, 'deleted': 0}
+        )
+        self.landmark.refresh_from_db()
+        self.assertDictEqual(
+            self.landmark.translations_data['tr'],
+            {'name': 'Katedral', 'description': 'Bir kilise'}
+        )
+
+    def test_write_cleared(self):
+        counts = self.storage.write(
+            {'1': self.landmark},
+            'tr',
+            [],
+            [('1', 'name')],
+        )
+
+        self.assertDictEqual(
+            counts,
+            {'created': 0, 'updated': 0, 'deleted': 1}
+        )
+        self.landmark.refresh_from_db()
+        self.assertNotIn('tr', self.landmark.translations_data)
+
+    def test_write_unchanged_num_queries(self):
+        with CaptureQueriesContext(connection) as captured:
+            self.storage.write(
+                {'1': self.landmark},
+                'de',
+                [('1', 'name', 'Dom')],
+                [],
+            )
+
+        self.assertEqual(len(captured), 0)
+
+    def test_write_concurrent(self):
+        Landmark.objects.filter(pk=self.landmark.pk).update(
+            translations_data={
+                'de': {'name': 'Dom', 'description': 'Eine gotische Kirche'},
+                'tr': {'name': 'Katedral', 'description': 'Bir kilise'},
+            },
+        )
+
+        counts = self.storage.write(
+            {'1': self.landmark},
+            'de',
+            [('1', 'name', 'Kathedrale')],
+            [],
+        )
+
+        self.assertDictEqual(
+            counts,
+            {'created': 0, 'updated': 1, 'deleted': 0}
+        )
+        self.landmark.refresh_from_db()
+        self.assertDictEqual(
+            self.landmark.translations_data,
+            {
+                'de': {
+                    'name': 'Kathedrale',
+                    'description': 'Eine gotische Kirche',
+                },
+                'tr': {'name': 'Katedral', 'description': 'Bir kilise'},
+            }
+        )
+
+    def test_delete(self):
+        self.storage.delete({'1': self.landmark}, 'de')
+
+        self.landmark.refresh_from_db()
+        self.assertDictEqual(
+            self.landmark.translations_data,
+            {'tr': {'name': 'Katedral'}}
+        )
+
+    def test_delete_fields(self):
+        self.storage.delete({'1': self.landmark}, 'de', ['name'])
+
+        self.landmark.refresh_from_db()
+        self.assertDictEqual(
+            self.landmark.translations_data['de'],
+            {'description': 'Eine gotische Kirche'}
+        )
+
+    def test_delete_concurrent(self):
+        Landmark.objects.filter(pk=self.landmark.pk).update(
+            translations_data={
+                'de': {'name': 'Dom', 'description': 'Eine gotische Kirche'},
+                'tr': {'name': 'Katedral', 'description': 'Bir kilise'},
+            },
+        )
+
+        self.storage.delete({'1': self.landmark}, 'de')
+
+        self.landmark.refresh_from_db()
+        self.assertDictEqual(
+            self.landmark.translations_data,
+            {'tr': {'name': 'Katedral', 'description': 'Bir kilise'}}
+        )
+
+    def test_context_read_num_queries(self):
+        landmarks = list(Landmark.objects.all())
+        ContentType.objects.get_for_model(Landmark)
+
+        with CaptureQueriesContext(connection) as captured:
+            with Context(landmarks) as context:
+                context.read('de')
+
+        self.assertEqual(len(captured), 0)
+        self.assertEqual(landmarks[0].name, 'Dom')
+        self.assertEqual(landmarks[0].description, 'Eine gotische Kirche')
+
+    def test_context_read_fallback(self):
+        landmark = Landmark.objects.get()
+
+        with Context(landmark) as context:
+            context.read(['tr', 'de'])
+
+        self.assertEqual(landmark.name, 'Katedral')
+        self.assertEqual(landmark.description, 'Eine gotische Kirche')
+
+    def test_context_read_related(self):
+        city = City.objects.get()
+
+        with Context(city, 'landmarks') as context:
+            context.read('de')
+
+        self.assertEqual(city.name, 'Köln')
+        self.assertEqual(city.landmarks.all()[0].name, 'Dom')
+
+    def test_context_update(self):
+        landmark = Landmark.objects.get()
+
+        with Context(landmark) as context:
+            landmark.name = 'Kathedrale'
+            landmark.description = ''
+            counts = context.update('de')
+
+        self.assertDictEqual(
+            counts,
+            {'created': 0, 'updated': 1, 'deleted': 1}
+        )
+        landmark.refresh_from_db()
+        self.assertDictEqual(
+            landmark.translations_data['de'],
+            {'name': 'Kathedrale'}
+        )
+        self.assertFalse(Translation.objects.filter(
+            content_type=ContentType.objects.get_for_model(Landmark)
+        ).exists())
+
+    def test_context_update_concurrent(self):
+        landmark = Landmark.objects.get()
+        Landmark.objects.filter(pk=landmark.pk).update(
+            translations_data={
+                'de': {'name': 'Dom', 'description': 'Eine gotische Kirche'},
+                'tr': {'name': 'Katedral', 'description': 'Bir kilise'},
+            },
+        )
+
+        with Context(landmark) as context:
+            landmark.name = 'Kathedrale'
+            context.update('de')
+
+        landmark.refresh_from_db()
+        self.assertDictEqual(
+            landmark.translations_data['tr'],
+            {'name': 'Katedral', 'description': 'Bir kilise'}
+        )
+
+    def test_context_delete(self):
+        landmark = Landmark.objects.get()
+
+        with Context(landmark) as context:
+            context.delete('tr')
+
+        landmark.refresh_from_db()
+        self.assertNotIn('tr', landmark.translations_data)
+
+    def test_queryset_translate(self):
+        landmark = Landmark.objects.translate('de').get()
+
+        self.assertEqual(landmark.name, 'Dom')
+
+    def test_queryset_translate_inline(self):
+        ContentType.objects.get_for_model(Landmark)
+
+        with self.assertNumQueries(1):
+            landmark = Landmark.objects.translate('de', inline=True).get()
+
+        self.assertEqual(landmark.name, 'Dom')
+
+    def test_queryset_translate_values(self):
+        self.assertListEqual(
+            list(Landmark.objects.translate('de').values_list(
+                'name', 'description'
+            )),
+            [
+                ('Dom', 'Eine gotische Kirche'),
+            ]
+        )
+
+    def test_queryset_filter(self):
+        self.assertEqual(
+            Landmark.objects.probe('de').filter(name='Dom').count(),
+            1
+        )
+        self.assertEqual(
+            Landmark.objects.probe(['en', 'tr']).filter(
+                name__startswith='Kat'
+            ).count(),
+            1
+        )
+        self.assertEqual(
+            Landmark.objects.probe('tr').filter(name='Dom').count(),
+            0
+        )
+
+    def test_queryset_filter_related(self):
+        self.assertEqual(
+            City.objects.probe('de').filter(landmarks__name='Dom').count(),
+            1
+        )
+
+    def test_queryset_order_by(self):
+        Landmark.objects.create(
+            name='Bridge',
+            city=self.landmark.city,
+            translations_data={'de': {'name': 'Brücke'}},
+        )
+
+        self.assertListEqual(
+            [x.name for x in Landmark.objects.order_by('name')],
+            ['Bridge', 'Cathedral']
+        )
+        self.assertListEqual(
+            [x.name for x in Landmark.objects.translate('de').order_by(
+                '-name'
+            )],
+            ['Dom', 'Brücke']
+        )
@@ -1,10 +1,24 @@
 from tests.test_case import TranslationTestCase
+from django.test import override_settings
+from django.core.cache import caches
 from django.core.exceptions import FieldDoesNotExist
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models import Q
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.admin.models import LogEntry, ADDITION
+from django.contrib.auth.models import User
 
 from translations.utils import _get_reverse_relation, _get_dissected_lookup, \
-    _get_relations_hierarchy, _get_entity_details, \
-    _get_purview, _get_translations
+    _get_relations_hierarchy, _get_entity_details, _prefetch_relation, \
+    _get_purview, _get_grouped_query, _get_chunked_groups, \
+    _get_translations, _get_translations_cache, \
+    _get_translations_cache_generations, \
+    _get_translations_cache_presences, _get_translations_cache_key, \
+    _clear_translations_cache, _bump_translations_cache, \
+    _translations_memo, _TranslationsMemo
+
+from translations.models import Translation
 
 from sample.models import Continent, Country, City
 from sample.utils import create_samples
@@ -225,6 +239,12 @@ class GetDissectedLookupTest(TranslationTestCase):
             }
         )
 
+    def test_memoized(self):
+        self.assertIs(
+            _get_dissected_lookup(Continent, 'countries__name__icontains'),
+            _get_dissected_lookup(Continent, 'countries__name__icontains'),
+        )
+
 
 class GetRelationsHierarchyTest(TranslationTestCase):
     """Tests for `_get_relations_hierarchy`."""
@@ -581,6 +601,87 @@ class GetEntityDetailsTest(TranslationTestCase):
         )
 
 
+class PrefetchRelationTest(TranslationTestCase):
+    """Tests for `_prefetch_relation`."""
+
+    def test_reverse_relation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+        )
+
+        continents = list(Continent.objects.all())
+
+        with self.assertNumQueries(1):
+            _prefetch_relation(continents, 'countries')
+        with self.assertNumQueries(0):
+            self.assertListEqual(
+                sorted(
+                    country.name
+                    for continent in continents
+                    for country in continent.countries.all()
+                ),
+                ['Germany', 'South Korea']
+            )
+
+    def test_reverse_relation_default_accessor(self):
+        for username in ['behzad', 'max']:
+            LogEntry.objects.create(
+                user=User.objects.create(username=username),
+                object_repr=username,
+                action_flag=ADDITION,
+            )
+
+        users = list(User.objects.order_by('username'))
+
+        with self.assertNumQueries(1):
+            _prefetch_relation(users, 'logentry_set')
+        with self.assertNumQueries(0):
+            self.assertListEqual(
+                [
+                    entry.object_repr
+                    for user in users
+                    for entry in user.logentry_set.all()
+                ],
+                ['behzad', 'max']
+            )
+
+    def test_prefetched_relation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+        )
+
+        continents = list(Continent.objects.prefetch_related('countries'))
+
+        with self.assertNumQueries(0):
+            _prefetch_relation(continents, 'countries')
+
+    def test_forward_relation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+        )
+
+        countries = list(Country.objects.all())
+
+        with self.assertNumQueries(1):
+            _prefetch_relation(countries, 'continent')
+        with self.assertNumQueries(0):
+            self.assertListEqual(
+                sorted(country.continent.name for country in countries),
+                ['Asia', 'Europe']
+            )
+
+    def test_not_relation(self):
+        create_samples(continent_names=['europe'])
+
+        continents = list(Continent.objects.all())
+
+        with self.assertNumQueries(0):
+            _prefetch_relation(continents, 'name')
+
+
 class GetPurviewTest(TranslationTestCase):
     """Tests for `_get_purview`."""
 
@@ -1174,6 +1275,75 @@ class GetPurviewTest(TranslationTestCase):
             }
         )
 
+    def test_queryset_level_0_relation_deferred_fields(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = list(Continent.objects.defer('name', 'denonym'))
+        hierarchy = _get_relations_hierarchy()
+
+        _get_purview(continents, hierarchy, ['name'])
+
+        for continent in continents:
+            self.assertIsNone(continent._translatable_snapshot)
+            self.assertSetEqual(continent.get_deferred_fields(), {'denonym'})
+
+    def test_queryset_level_1_2_relation_num_queries(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            city_names=['cologne', 'seoul'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        lvl_1_2 = ('countries', 'countries__cities',)
+
+        continents = list(Continent.objects.all())
+        hierarchy = _get_relations_hierarchy(*lvl_1_2)
+
+        ct_continent = ContentType.objects.get_for_model(Continent)
+        ct_country = ContentType.objects.get_for_model(Country)
+        ct_city = ContentType.objects.get_for_model(City)
+
+        # one prefetch per level, regardless of the number of objects
+        with self.assertNumQueries(2):
+            mapping, query = _get_purview(continents, hierarchy)
+
+        self.assertEqual(len(mapping[ct_continent.id]), 2)
+        self.assertEqual(len(mapping[ct_country.id]), 2)
+        self.assertEqual(len(mapping[ct_city.id]), 2)
+
+    def test_forward_relation_num_queries(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            city_names=['cologne', 'seoul'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        lvl_2 = ('country__continent',)
+
+        cities = list(City.objects.all())
+        hierarchy = _get_relations_hierarchy(*lvl_2)
+
+        ct_continent = ContentType.objects.get_for_model(Continent)
+        ct_city = ContentType.objects.get_for_model(City)
+
+        with self.assertNumQueries(2):
+            mapping, query = _get_purview(cities, hierarchy)
+
+        self.assertEqual(len(mapping[ct_continent.id]), 2)
+        self.assertEqual(len(mapping[ct_city.id]), 2)
+
     def test_invalid_instance(self):
         class Person:
             def __init__(self, name):
@@ -1221,6 +1391,161 @@ class GetPurviewTest(TranslationTestCase):
         )
 
 
+class GetGroupedQueryTest(TranslationTestCase):
+    """Tests for `_get_grouped_query`."""
+
+    def test_no_groups(self):
+        query = _get_grouped_query([])
+
+        self.assertFalse(query)
+
+    def test_one_group(self):
+        query = _get_grouped_query([
+            ({'content_type__id': 1}, ['1', '2', '3']),
+        ])
+
+        self.assertEqual(
+            query,
+            Q(
+                Q(content_type__id=1, object_id__in=['1', '2', '3']),
+                _connector=Q.OR,
+            )
+        )
+
+    def test_many_groups(self):
+        query = _get_grouped_query([
+            ({'content_type__id': 1}, ['1', '2']),
+            ({'content_type__id': 2, 'field': 'name'}, ['3']),
+        ])
+
+        self.assertEqual(
+            query,
+            Q(
+                Q(content_type__id=1, object_id__in=['1', '2']),
+                Q(content_type__id=2, field='name', object_id__in=['3']),
+                _connector=Q.OR,
+            )
+        )
+
+    def test_purview_query_grouped_by_content_type(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        lvl_1 = ('countries',)
+
+        continents = Continent.objects.all()
+        hierarchy = _get_relations_hierarchy(*lvl_1)
+
+        ct_continent = ContentType.objects.get_for_model(Continent)
+        ct_country = ContentType.objects.get_for_model(Country)
+
+        mapping, query = _get_purview(continents, hierarchy)
+
+        self.assertEqual(
+            query,
+            Q(
+                Q(
+                    content_type__id=ct_continent.id,
+                    object_id__in=list(mapping[ct_continent.id]),
+                ),
+                Q(
+                    content_type__id=ct_country.id,
+                    object_id__in=list(mapping[ct_country.id]),
+                ),
+                _connector=Q.OR,
+            )
+        )
+
+
+class GetChunkedGroupsTest(TranslationTestCase):
+    """Tests for `_get_chunked_groups`."""
+
+    def test_no_groups(self):
+        self.assertListEqual(
+            list(_get_chunked_groups([], 3)),
+            []
+        )
+
+    def test_no_size(self):
+        groups = [
+            ({'content_type__id': 1}, ['1', '2', '3']),
+            ({'content_type__id': 2}, []),
+            ({'content_type__id': 3}, ['1']),
+        ]
+
+        self.assertListEqual(
+            list(_get_chunked_groups(groups)),
+            [
+                [
+                    ({'content_type__id': 1}, ['1', '2', '3']),
+                    ({'content_type__id': 3}, ['1']),
+                ],
+            ]
+        )
+
+    def test_group_fits_size(self):
+        groups = [
+            ({'content_type__id': 1}, ['1', '2']),
+            ({'content_type__id': 2}, ['1']),
+        ]
+
+        self.assertListEqual(
+            list(_get_chunked_groups(groups, 5)),
+            [
+                [
+                    ({'content_type__id': 1}, ['1', '2']),
+                    ({'content_type__id': 2}, ['1']),
+                ],
+            ]
+        )
+
+    def test_group_exceeds_size(self):
+        groups = [
+            ({'content_type__id': 1}, ['1', '2', '3', '4', '5']),
+            ({'content_type__id': 2}, ['1']),
+        ]
+
+        self.assertListEqual(
+            list(_get_chunked_groups(groups, 3)),
+            [
+                [
+                    ({'content_type__id': 1}, ['1', '2']),
+                ],
+                [
+                    ({'content_type__id': 1}, ['3', '4']),
+                ],
+                [
+                    ({'content_type__id': 1}, ['5']),
+                ],
+                [
+                    ({'content_type__id': 2}, ['1']),
+                ],
+            ]
+        )
+
+    def test_lookups_exceed_size(self):
+        groups = [
+            ({'content_type__id': 1, 'field': 'name'}, ['1', '2']),
+        ]
+
+        self.assertListEqual(
+            list(_get_chunked_groups(groups, 2)),
+            [
+                [
+                    ({'content_type__id': 1, 'field': 'name'}, ['1']),
+                ],
+                [
+                    ({'content_type__id': 1, 'field': 'name'}, ['2']),
+                ],
+            ]
+        )
+
+
 class GetTranslationsTest(TranslationTestCase):
     """Tests for `_get_translations`."""
 
@@ -1334,6 +1659,25 @@ class GetTranslationsTest(TranslationTestCase):
             transform=repr
         )
 
+    def test_instance_level_0_relation_with_lang_and_fields(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        europe = Continent.objects.get(code='EU')
+        hierarchy = _get_relations_hierarchy()
+        mapping, query = _get_purview(europe, hierarchy)
+
+        self.assertQuerySetEqual(
+            _get_translations(query, 'de', ['denonym']).order_by('id'),
+            [
+                '<Translation: European: Europäisch>',
+            ],
+            transform=repr
+        )
+
     def test_queryset_level_0_relation_with_lang(self):
         create_samples(
             continent_names=['europe', 'asia'],
@@ -1459,3 +1803,390 @@ class GetTranslationsTest(TranslationTestCase):
             ],
             transform=repr
         )
+
+
+class GetTranslationsCacheTest(TranslationTestCase):
+    """Tests for `_get_translations_cache`."""
+
+    def test_disabled(self):
+        self.assertIsNone(_get_translations_cache())
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_enabled(self):
+        self.assertIs(_get_translations_cache(), caches['default'])
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_memo(self):
+        memo = {}
+        token = _translations_memo.set(memo)
+        try:
+            cache = _get_translations_cache()
+        finally:
+            _translations_memo.reset(token)
+
+        self.assertIsInstance(cache, _TranslationsMemo)
+        self.assertIs(cache.memo, memo)
+        self.assertIs(cache.cache, caches['default'])
+
+
+class TranslationsMemoTest(TranslationTestCase):
+    """Tests for `_TranslationsMemo`."""
+
+    def test_get_many_memo(self):
+        memo = _TranslationsMemo({'a': 1})
+
+        self.assertDictEqual(memo.get_many(['a', 'b']), {'a': 1})
+
+    def test_get_many_cache(self):
+        cache = caches['default']
+        cache.clear()
+        cache.set('translations:b', 2)
+        memo = _TranslationsMemo({'translations:a': 1}, cache)
+
+        self.assertDictEqual(
+            memo.get_many(['translations:a', 'translations:b']),
+            {'translations:a': 1, 'translations:b': 2}
+        )
+        self.assertDictEqual(
+            memo.memo,
+            {'translations:a': 1, 'translations:b': 2}
+        )
+
+    def test_set_many(self):
+        cache = caches['default']
+        cache.clear()
+        memo = _TranslationsMemo({}, cache)
+        memo.set_many({'translations:a': 1})
+
+        self.assertDictEqual(memo.memo, {'translations:a': 1})
+        self.assertEqual(cache.get('translations:a'), 1)
+
+    def test_delete_many(self):
+        cache = caches['default']
+        cache.clear()
+        cache.set('translations:a', 1)
+        memo = _TranslationsMemo({'translations:a': 1}, cache)
+        memo.delete_many(['translations:a'])
+
+        self.assertDictEqual(memo.memo, {})
+        self.assertIsNone(cache.get('translations:a'))
+
+    def test_add_memo(self):
+        memo = _TranslationsMemo({'a': 1})
+
+        self.assertFalse(memo.add('a', 2))
+        self.assertTrue(memo.add('b', 2))
+        self.assertDictEqual(memo.memo, {'a': 1, 'b': 2})
+
+    def test_add_cache(self):
+        cache = caches['default']
+        cache.clear()
+        cache.set('translations:a', 1)
+        memo = _TranslationsMemo({'translations:a': 3}, cache)
+
+        self.assertFalse(memo.add('translations:a', 2))
+        self.assertDictEqual(
+            memo.get_many(['translations:a']),
+            {'translations:a': 1}
+        )
+
+    def test_incr_memo(self):
+        memo = _TranslationsMemo({'a': 1})
+
+        self.assertEqual(memo.incr('a'), 2)
+        with self.assertRaises(ValueError):
+            memo.incr('b')
+
+    def test_incr_cache(self):
+        cache = caches['default']
+        cache.clear()
+        cache.set('translations:a', 1)
+        memo = _TranslationsMemo({'translations:a': 1}, cache)
+
+        self.assertEqual(memo.incr('translations:a'), 2)
+        self.assertEqual(cache.get('translations:a'), 2)
+        with self.assertRaises(ValueError):
+            memo.incr('translations:b')
+
+
+class GetTranslationsCacheGenerationsTest(TranslationTestCase):
+    """Tests for `_get_translations_cache_generations`."""
+
+    def test_existing(self):
+        cache = caches['default']
+        cache.clear()
+        cache.set('translations:generation:1:de', 5)
+
+        self.assertDictEqual(
+            _get_translations_cache_generations(cache, [(1, 'de')]),
+            {(1, 'de'): 5}
+        )
+
+    def test_missing(self):
+        cache = caches['default']
+        cache.clear()
+        cache.set('translations:generation:1:de', 5)
+
+        generations = _get_translations_cache_generations(
+            cache,
+            [(1, 'de'), (1, 'tr')],
+        )
+
+        self.assertGreater(generations[(1, 'tr')], 5)
+        self.assertEqual(
+            cache.get('translations:generation:1:tr'),
+            generations[(1, 'tr')]
+        )
+
+
+class GetTranslationsCachePresencesTest(TranslationTestCase):
+    """Tests for `_get_translations_cache_presences`."""
+
+    def test_built(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        Translation.objects.filter(object_id='AS').delete()
+        cache = caches['default']
+        cache.clear()
+        continent = ContentType.objects.get_for_model(Continent).id
+        country = ContentType.objects.get_for_model(Country).id
+
+        with self.assertNumQueries(1):
+            presences = _get_translations_cache_presences(
+                cache,
+                {
+                    (continent, 'de'): 5,
+                    (continent, 'tr'): 5,
+                    (country, 'de'): 5,
+                },
+                {continent: ['EU', 'AS'], country: ['DE']},
+            )
+
+        self.assertDictEqual(
+            presences,
+            {
+                (continent, 'de'): frozenset(['EU']),
+                (continent, 'tr'): frozenset(),
+                (country, 'de'): frozenset(['DE']),
+            }
+        )
+        self.assertEqual(
+            cache.get(
+                'translations:presence:{}:de:5:AS'.format(continent)
+            ),
+            frozenset(),
+        )
+
+    def test_built_buckets(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+        cache = caches['default']
+        cache.clear()
+        continent = ContentType.objects.get_for_model(Continent).id
+
+        with self.assertNumQueries(1):
+            presences = _get_translations_cache_presences(
+                cache,
+                {(continent, 'de'): 5},
+                {continent: ['EU']},
+            )
+
+        self.assertDictEqual(
+            presences,
+            {(continent, 'de'): frozenset(['EU'])}
+        )
+        self.assertIsNone(
+            cache.get('translations:presence:{}:de:5:AS'.format(continent))
+        )
+
+    def test_cached(self):
+        cache = caches['default']
+        cache.clear()
+        cache.set('translations:presence:1:de:5:EU', frozenset(['EU']))
+
+        with self.assertNumQueries(0):
+            presences = _get_translations_cache_presences(
+                cache,
+                {(1, 'de'): 5},
+                {1: ['EU']},
+            )
+
+        self.assertDictEqual(presences, {(1, 'de'): frozenset(['EU'])})
+
+    def test_memo(self):
+        with self.assertNumQueries(0):
+            presences = _get_translations_cache_presences(
+                _TranslationsMemo({}),
+                {(1, 'de'): 5},
+                {1: ['EU']},
+            )
+
+        self.assertIsNone(presences)
+
+
+class GetTranslationsCacheKeyTest(TranslationTestCase):
+    """Tests for `_get_translations_cache_key`."""
+
+    def test_key(self):
+        self.assertEqual(
+            _get_translations_cache_key(1, 'EU', 'de', 5),
+            'translations:1:EU:de:5'
+        )
+
+
+class ClearTranslationsCacheTest(TranslationTestCase):
+    """Tests for `_clear_translations_cache`."""
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_clear(self):
+        cache = caches['default']
+        cache.clear()
+        cache.set_many({
+            'translations:generation:1:de': 5,
+            'translations:generation:1:tr': 5,
+            'translations:1:EU:de:5': {'name': 'Europa'},
+            'translations:1:EU:tr:5': {'name': 'Avrupa'},
+        })
+
+        _clear_translations_cache([(1, 'EU', 'de')])
+
+        self.assertDictEqual(
+            cache.get_many([
+                'translations:1:EU:de:5',
+                'translations:1:EU:tr:5',
+            ]),
+            {'translations:1:EU:tr:5': {'name': 'Avrupa'}}
+        )
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_clear_atomic(self):
+        cache = caches['default']
+        cache.clear()
+        cache.set('translations:generation:1:de', 5)
+
+        with transaction.atomic():
+            _clear_translations_cache([(1, 'EU', 'de')])
+            cache.set('translations:1:EU:de:5', {'name': 'Europa'})
+
+        self.assertIsNone(cache.get('translations:1:EU:de:5'))
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_receiver_created(self):
+        create_samples(continent_names=['europe'])
+        ct_id = ContentType.objects.get_for_model(Continent).id
+        cache = caches['default']
+        cache.clear()
+        cache.set_many({
+            'translations:generation:{}:de'.format(ct_id): 5,
+            'translations:generation:{}:tr'.format(ct_id): 5,
+        })
+
+        # the presences do not have the object yet, so they are cleared
+        # at once by bumping the generation
+        Translation.objects.create(
+            content_type_id=ct_id,
+            object_id='EU',
+            field='name',
+            language='de',
+            text='Europa',
+        )
+
+        self.assertDictEqual(
+            cache.get_many([
+                'translations:generation:{}:de'.format(ct_id),
+                'translations:generation:{}:tr'.format(ct_id),
+            ]),
+            {
+                'translations:generation:{}:de'.format(ct_id): 6,
+                'translations:generation:{}:tr'.format(ct_id): 5,
+            }
+        )
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_receivers_connected(self):
+        self.assertTrue(post_delete.has_listeners(Translation))
+
+    @override_settings(MIDDLEWARE=['translations.middleware.memo_middleware'])
+    def test_receivers_connected_memo(self):
+        self.assertTrue(post_delete.has_listeners(Translation))
+
+    def test_receivers_disconnected(self):
+        self.assertFalse(post_delete.has_listeners(Translation))
+
+
+class BumpTranslationsCacheTest(TranslationTestCase):
+    """Tests for `_bump_translations_cache`."""
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_bump(self):
+        cache = caches['default']
+        cache.clear()
+        cache.set_many({
+            'translations:generation:1:de': 5,
+            'translations:generation:1:tr': 5,
+        })
+
+        _bump_translations_cache([(1, 'de')])
+
+        self.assertDictEqual(
+            cache.get_many([
+                'translations:generation:1:de',
+                'translations:generation:1:tr',
+            ]),
+            {
+                'translations:generation:1:de': 6,
+                'translations:generation:1:tr': 5,
+            }
+        )
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_bump_all_languages(self):
+        cache = caches['default']
+        cache.clear()
+        cache.set_many({
+            'translations:generation:1:de': 5,
+            'translations:generation:1:tr': 5,
+        })
+
+        _bump_translations_cache([(1, None)])
+
+        self.assertDictEqual(
+            cache.get_many([
+                'translations:generation:1:de',
+                'translations:generation:1:tr',
+            ]),
+            {
+                'translations:generation:1:de': 6,
+                'translations:generation:1:tr': 6,
+            }
+        )
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_bump_missing(self):
+        cache = caches['default']
+        cache.clear()
+
+        _bump_translations_cache([(1, 'de')])
+
+        self.assertIsNone(cache.get('translations:generation:1:de'))
+
+    @override_settings(TRANSLATIONS_CACHE='default')
+    def test_bump_atomic(self):
+        cache = caches['default']
+        cache.clear()
+        cache.set('translations:generation:1:de', 5)
+
+        with transaction.atomic():
+            _bump_translations_cache([(1, 'de')])
+
+            self.assertEqual(cache.get('translations:generation:1:de'), 6)
+
+        self.assertEqual(cache.get('translations:generation:1:de'), 7)
@@ -1,4 +1,7 @@
-from django.apps import AppConfig
+from django.apps import AppConfig, apps
+from django.core import checks
+from django.core.signals import setting_changed
+from django.db.models.signals import class_prepared
 try:
     from django.utils.translation import ugettext_lazy as _
 except ImportError:
@@ -8,3 +11,38 @@ except ImportError:
 class TranslationsConfig(AppConfig):
     name = 'translations'
     verbose_name = _('translations')
+
+    def ready(self):
+        from translations.checks import check_object_ids
+        from translations.models import _contribute_translatable_descriptors
+        from translations.query import _clear_query_plans
+        from translations.utils import _connect_translations_cache
+        checks.register(check_object_ids)
+        # the memoized lookups may change with the models
+        class_prepared.connect(
+            _clear_query_plans,
+            dispatch_uid='translations_query_plans',
+        )
+        setting_changed.connect(
+            _clear_query_plans,
+            dispatch_uid='translations_query_plans_setting',
+        )
+        # the translatable fields are known once the models are ready
+        for model in apps.get_models():
+            _contribute_translatable_descriptors(model)
+        class_prepared.connect(
+            _contribute_prepared_descriptors,
+            dispatch_uid='translations_descriptors',
+        )
+        _connect_translations_cache()
+        setting_changed.connect(
+            _connect_translations_cache,
+            dispatch_uid='translations_cache_setting',
+        )
+
+
+def _contribute_prepared_descriptors(sender, **kwargs):
+    """Install the descriptors of the models prepared after the ready."""
+    from translations.models import _contribute_translatable_descriptors
+    if sender._meta.apps.models_ready:
+        _contribute_translatable_descriptors(sender)
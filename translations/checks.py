@@ -0,0 +1,58 @@
+"""This module contains the system checks for the Translations app."""
+
+from django.apps import apps
+from django.conf import settings
+from django.core import checks
+
+import translations.models
+
+
+__docformat__ = 'restructuredtext'
+
+
+_INTEGER_TYPES = frozenset([
+    'AutoField',
+    'BigAutoField',
+    'SmallAutoField',
+    'IntegerField',
+    'BigIntegerField',
+    'SmallIntegerField',
+    'PositiveIntegerField',
+    'PositiveBigIntegerField',
+    'PositiveSmallIntegerField',
+])
+
+
+def _get_primary_key_type(model):
+    """
+    Return the internal type of a model's primary key, following it to
+    the field it refers to if it is a relation.
+    """
+    pk = model._meta.pk
+    while pk.is_relation:
+        pk = pk.target_field
+    return pk.get_internal_type()
+
+
+def check_object_ids(app_configs=None, **kwargs):
+    """
+    Check that the translatable models have integer primary keys if
+    the translations' object ids are integers.
+    """
+    errors = []
+    if getattr(settings, 'TRANSLATIONS_INTEGER_OBJECT_ID', False):
+        for model in apps.get_models():
+            if issubclass(model, translations.models.Translatable) and \
+                    model._get_translatable_storage() is None and \
+                    _get_primary_key_type(model) not in _INTEGER_TYPES:
+                errors.append(checks.Error(
+                    '`{}` has a non-integer primary key, but the '
+                    'translations have integer object ids.'.format(
+                        model._meta.label,
+                    ),
+                    hint='Unset the TRANSLATIONS_INTEGER_OBJECT_ID setting '
+                         'or use an integer primary key.',
+                    obj=model,
+                    id='translations.E001',
+                ))
+    return errors
@@ -1,12 +1,22 @@
 """This module contains the context managers for the Translations app."""
 
-from django.db import models
+try:
+    from asgiref.sync import sync_to_async
+except ImportError:
+    # the async methods need Django 4.1, which comes with asgiref
+    sync_to_async = None
+
+from django.db import connections, router, transaction
+from django.contrib.contenttypes.models import ContentType
 
 import translations.models
 from translations.languages import _get_default_language, \
-    _get_translate_language
+    _get_translate_language, _get_fallback_languages
 from translations.utils import _get_relations_hierarchy, _get_purview, \
-    _get_translations
+    _get_grouped_query, _get_chunked_groups, _get_translations, \
+    _get_translations_cache, _get_translations_cache_generations, \
+    _get_translations_cache_presences, _get_translations_cache_key, \
+    _bump_translations_cache
 
 
 __docformat__ = 'restructuredtext'
@@ -15,10 +25,33 @@ __docformat__ = 'restructuredtext'
 class Context:
     """A context manager which provides custom translation functionalities."""
 
-    def __init__(self, entity, *relations):
-        """Initialize a `Context` with an entity and some relations of it."""
+    chunk_size = 1000
+
+    def __init__(self, entity, *relations, fields=None):
+        """
+        Initialize a `Context` with an entity and some relations of it
+        (optionally in some fields).
+        """
         hierarchy = _get_relations_hierarchy(*relations)
-        self.mapping, self.query = _get_purview(entity, hierarchy)
+        self.fields = None if fields is None else list(fields)
+        self.mapping, self.query = _get_purview(
+            entity,
+            hierarchy,
+            self.fields,
+        )
+
+        # the models with their own storages are kept out of the mapping
+        self.storages = {}
+        for ct_id in list(self.mapping):
+            model = ContentType.objects.get_for_id(ct_id).model_class()
+            storage = model._get_translatable_storage()
+            if storage is not None:
+                self.storages[ct_id] = (storage, self.mapping.pop(ct_id))
+        if self.storages:
+            self.query = _get_grouped_query(
+                ({'content_type__id': ct_id}, list(objs))
+                for (ct_id, objs) in self.mapping.items()
+            )
 
     def __enter__(self):
         return self
@@ -26,21 +59,146 @@ class Context:
     def __exit__(self, exc_type, exc_value, traceback):
         pass
 
-    def _get_changed_fields(self):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def _get_fields_names(self, model):
         r"""
-        Yield the info about the changed fields in the `Context`\ 's `purview`.
+        Return the names of a model's translatable fields in
+        the `Context`\ 's `fields`.
         """
-        for (ct_id, objs) in self.mapping.items():
+        names = model._get_translatable_fields_names()
+        if self.fields is None:
+            return names
+        return [field for field in names if field in self.fields]
+
+    def _get_objects(self):
+        r"""
+        Return the objects of the `Context`\ 's `purview` in all
+        the storages.
+        """
+        objects = dict(self.mapping)
+        for (ct_id, (storage, objs)) in self.storages.items():
+            objects[ct_id] = objs
+        return objects
+
+    def _get_reserved_params(self, langs=1):
+        """Return the number of the parameters reserved in each query."""
+        return langs + (len(self.fields) if self.fields is not None else 0)
+
+    def _get_chunk_size(self, using, reserved=1):
+        """Return the size of the chunks which fit in a database."""
+        size = self.chunk_size
+        limit = connections[using].features.max_query_params
+        if limit:
+            # reserve some parameters for the languages
+            size = min(size, limit - reserved) if size else limit - reserved
+        return size
+
+    def _get_queries(self, groups, using, reserved=1):
+        """Yield the queries of some grouped object ids in chunks."""
+        size = self._get_chunk_size(using, reserved)
+        for chunk in _get_chunked_groups(groups, size):
+            yield _get_grouped_query(chunk)
+
+    def _get_purview_queries(self, using, reserved=1):
+        r"""Yield the queries of the `Context`\ 's `purview` in chunks."""
+        return self._get_queries(
+            [
+                ({'content_type__id': ct_id}, list(objs))
+                for (ct_id, objs) in self.mapping.items()
+            ],
+            using,
+            reserved,
+        )
+
+    def _get_upsert_options(self, using):
+        """
+        Return the options to upsert the translations in a database, or
+        `None` if the database does not support upserting.
+        """
+        features = connections[using].features
+        options = {
+            'update_conflicts': True,
+            'update_fields': ['text'],
+        }
+        if getattr(features, 'supports_update_conflicts_with_target', False):
+            options['unique_fields'] = list(
+                translations.models.Translation._meta.unique_together[0]
+            )
+            return options
+        elif getattr(features, 'supports_update_conflicts', False):
+            # the conflict target is implied by the unique key (e.g. MySQL)
+            return options
+        else:
+            return None
+
+    def _get_dirty_fields(self, mapping=None):
+        r"""
+        Yield the info about the assigned fields in the `Context`\ 's
+        `purview` (or a part of it).
+        """
+        if mapping is None:
+            mapping = self.mapping
+        for (ct_id, objs) in mapping.items():
             for (obj_id, obj) in objs.items():
-                for field in type(obj)._get_translatable_fields_names():
-                    text = getattr(obj, field, None)
-                    default = obj._default_translatable_fields.get(field, None)
-                    if text and text != default:
-                        yield ({
-                            'content_type_id': ct_id,
-                            'object_id': obj_id,
-                            'field': field,
-                        }, text)
+                snapshot = obj.__dict__.get('_translatable_snapshot')
+                if snapshot is not None and snapshot.dirty:
+                    dirty = obj._get_dirty_translatable_fields()
+                    defaults = obj._get_default_translatable_fields()
+                    for field in self._get_fields_names(type(obj)):
+                        if field in dirty:
+                            yield ({
+                                'content_type_id': ct_id,
+                                'object_id': obj_id,
+                                'field': field,
+                            }, getattr(obj, field, None), defaults.get(field))
+
+    def _get_changed_fields(self, mapping=None):
+        r"""
+        Yield the info about the changed fields in the `Context`\ 's `purview`
+        (or a part of it).
+        """
+        for (address, text, default) in self._get_dirty_fields(mapping):
+            if text and text != default:
+                yield (address, text)
+
+    def _get_cleared_fields(self, mapping=None):
+        r"""
+        Yield the info about the cleared fields in the `Context`\ 's `purview`
+        (or a part of it).
+        """
+        for (address, text, default) in self._get_dirty_fields(mapping):
+            if not text and default:
+                yield address
+
+    def _write_storages(self, lang, cleared=True):
+        r"""
+        Write the changed (and the cleared) fields of the `Context`\ 's
+        `storages` in a language.
+        """
+        counts = {'created': 0, 'updated': 0, 'deleted': 0}
+        for (ct_id, (storage, objs)) in self.storages.items():
+            mapping = {ct_id: objs}
+            written = storage.write(
+                objs,
+                lang,
+                [
+                    (address['object_id'], address['field'], text)
+                    for (address, text) in self._get_changed_fields(mapping)
+                ],
+                [
+                    (address['object_id'], address['field'])
+                    for address in self._get_cleared_fields(mapping)
+                ] if cleared else [],
+                self.chunk_size,
+            )
+            for key in counts:
+                counts[key] += written[key]
+        return counts
 
     def create(self, lang=None):
         r"""
@@ -53,23 +211,157 @@ class Context:
                     language=lang, text=text, **address
                 ) for address, text in self._get_changed_fields()
             ]
-            translations.models.Translation.objects.bulk_create(_translations)
+            # the base manager's queryset does not bump the cached
+            # translations itself, they are bumped once below
+            translations.models.Translation._base_manager.bulk_create(
+                _translations,
+                batch_size=self.chunk_size,
+            )
+            _bump_translations_cache(
+                {
+                    (translation.content_type_id, lang)
+                    for translation in _translations
+                },
+                router.db_for_write(translations.models.Translation),
+            )
+            self._write_storages(lang, cleared=False)
+
+    def _get_read_chunks(self, langs, using):
+        r"""
+        Yield the translations of the `Context`\ 's `purview` in some
+        languages in chunks, as (content_type_id, object_id, field, text,
+        language).
+        """
+        cache = _get_translations_cache()
+        if cache is not None:
+            yield from self._get_cached_read_chunks(cache, langs, using)
+        else:
+            for query in self._get_purview_queries(
+                using,
+                self._get_reserved_params(len(langs)),
+            ):
+                yield _get_translations(
+                    query,
+                    langs if len(langs) > 1 else langs[0],
+                    self.fields,
+                ).values_list(
+                    'content_type_id', 'object_id', 'field', 'text',
+                    'language',
+                )
+        for (ct_id, (storage, objs)) in self.storages.items():
+            yield storage.read(ct_id, objs, langs, self.fields)
+
+    def _get_cached_read_chunks(self, cache, langs, using):
+        r"""
+        Yield the translations of the `Context`\ 's `purview` in some
+        languages in chunks, serving them from a cache and fetching
+        (and caching) the missing ones.
+        """
+        # the entries are written in the generations read beforehand, so
+        # the entries of a read which races with a write are never served
+        generations = _get_translations_cache_generations(
+            cache,
+            [
+                (ct_id, language)
+                for ct_id in self.mapping
+                for language in langs
+            ],
+        )
+        # the objects which have no translations in a language are skipped
+        presences = _get_translations_cache_presences(
+            cache,
+            generations,
+            self.mapping,
+            using,
+        )
+        addresses = {}
+        for (ct_id, objs) in self.mapping.items():
+            for obj_id in objs:
+                for language in langs:
+                    if presences is None or \
+                            obj_id in presences[(ct_id, language)]:
+                        key = _get_translations_cache_key(
+                            ct_id,
+                            obj_id,
+                            language,
+                            generations[(ct_id, language)],
+                        )
+                        addresses[key] = (ct_id, obj_id, language)
+        cached = cache.get_many(list(addresses))
+
+        # the objects which miss any language are fetched in all of them
+        missing = {}
+        for (key, (ct_id, obj_id, language)) in addresses.items():
+            if key not in cached:
+                missing.setdefault(ct_id, {})[obj_id] = None
+
+        yield [
+            (ct_id, obj_id, field, text, language)
+            for (key, (ct_id, obj_id, language)) in addresses.items()
+            if key in cached and obj_id not in missing.get(ct_id, ())
+            for (field, text) in cached[key].items()
+            if self.fields is None or field in self.fields
+        ]
+
+        for chunk in _get_chunked_groups(
+            [
+                ({'content_type__id': ct_id}, list(ids))
+                for (ct_id, ids) in missing.items()
+            ],
+            self._get_chunk_size(using, len(langs)),
+        ):
+            # the objects without translations in a language are cached too
+            entries = {
+                (lookups['content_type__id'], obj_id, language): {}
+                for (lookups, ids) in chunk
+                for obj_id in ids
+                for language in langs
+                if presences is None or
+                obj_id in presences[(lookups['content_type__id'], language)]
+            }
+            rows = list(_get_translations(
+                _get_grouped_query(chunk),
+                langs if len(langs) > 1 else langs[0],
+            ).values_list(
+                'content_type_id', 'object_id', 'field', 'text', 'language',
+            ))
+            for (ct_id, obj_id, field, text, language) in rows:
+                entries.setdefault((ct_id, obj_id, language), {})[field] = text
+            cache.set_many({
+                _get_translations_cache_key(
+                    ct_id, obj_id, language, generations[(ct_id, language)]
+                ): entry
+                for ((ct_id, obj_id, language), entry) in entries.items()
+            })
+            yield [
+                row for row in rows
+                if self.fields is None or row[2] in self.fields
+            ]
 
     def read(self, lang=None):
         r"""
-        Read the translations of the `Context`\ 's `purview` in a language.
+        Read the translations of the `Context`\ 's `purview` in some
+        language(s).
         """
-        lang = _get_translate_language(lang)
-        if lang != _get_default_language():
-            _translations = _get_translations(self.query, lang)
-            for translation in _translations:
-                ct_id = translation.content_type.id
-                obj_id = translation.object_id
-                field = translation.field
-                text = translation.text
-                obj = self.mapping[ct_id][obj_id]
-                if field in type(obj)._get_translatable_fields_names():
-                    setattr(obj, field, text)
+        langs = _get_fallback_languages(lang)
+        if langs:
+            priorities = {x: i for (i, x) in enumerate(langs)}
+            using = router.db_for_read(translations.models.Translation)
+            objects = self._get_objects()
+            for _translations in self._get_read_chunks(langs, using):
+                # the chunks never divide an object, so the resolved
+                # priorities of a chunk are not needed in the next ones
+                resolved = {}
+                for (ct_id, obj_id, field, text, language) in _translations:
+                    obj = objects[ct_id][obj_id]
+                    if field in type(obj)._get_translatable_fields_names():
+                        if len(langs) > 1:
+                            address = (ct_id, obj_id, field)
+                            priority = priorities[language]
+                            if resolved.get(address, priority) < priority:
+                                continue
+                            resolved[address] = priority
+                        obj._set_translated_field(field, text)
         else:
             self.reset()
 
@@ -77,19 +369,102 @@ class Context:
         r"""
         Update the translations of the `Context`\ 's `purview` in a language.
         """
+        counts = {'created': 0, 'updated': 0, 'deleted': 0}
         lang = _get_translate_language(lang)
         if lang != _get_default_language():
-            query = models.Q()
-            _translations = []
-            for address, text in self._get_changed_fields():
-                query |= models.Q(**address)
-                _translations.append(
-                    translations.models.Translation(
-                        language=lang, text=text, **address
+            Translation = translations.models.Translation
+            using = router.db_for_write(Translation)
+
+            stored = {}
+            for query in self._get_purview_queries(
+                using,
+                self._get_reserved_params(),
+            ):
+                for (pk, ct_id, obj_id, field, text) in _get_translations(
+                    query,
+                    lang,
+                    self.fields,
+                ).using(using).values_list(
+                    'id', 'content_type_id', 'object_id', 'field', 'text',
+                ):
+                    stored[(ct_id, obj_id, field)] = (pk, text)
+
+            created = []
+            updated = []
+            touched = set()
+            for (address, text) in self._get_changed_fields():
+                key = (
+                    address['content_type_id'],
+                    address['object_id'],
+                    address['field'],
+                )
+                if key not in stored:
+                    touched.add((key[0], lang))
+                    created.append(
+                        Translation(language=lang, text=text, **address)
+                    )
+                elif stored[key][1] != text:
+                    touched.add((key[0], lang))
+                    updated.append(
+                        Translation(
+                            id=stored[key][0],
+                            language=lang,
+                            text=text,
+                            **address
+                        )
                     )
+
+            deleted = []
+            for address in self._get_cleared_fields():
+                key = (
+                    address['content_type_id'],
+                    address['object_id'],
+                    address['field'],
                 )
-            _get_translations(query, lang).delete()
-            translations.models.Translation.objects.bulk_create(_translations)
+                if key in stored:
+                    touched.add((key[0], lang))
+                    deleted.append(stored[key][0])
+
+            upsert = self._get_upsert_options(using)
+            # the base manager's queryset does not bump the cached
+            # translations itself (with a query per batch), they are
+            # bumped once below
+            manager = Translation._base_manager
+            with transaction.atomic(using=using):
+                if upsert is None:
+                    manager.bulk_create(
+                        created,
+                        batch_size=self.chunk_size,
+                    )
+                    manager.bulk_update(
+                        updated,
+                        ['text'],
+                        batch_size=self.chunk_size,
+                    )
+                else:
+                    # the existing rows are updated through the conflicts,
+                    # which also covers the rows created in the meantime
+                    for translation in updated:
+                        translation.id = None
+                    manager.bulk_create(
+                        created + updated,
+                        batch_size=self.chunk_size,
+                        **upsert
+                    )
+                for chunk in _get_chunked_groups(
+                    [({}, deleted)],
+                    self._get_chunk_size(using, 0),
+                ):
+                    Translation.objects.filter(
+                        id__in=chunk[0][1],
+                    ).delete()
+            _bump_translations_cache(touched, using)
+
+            counts = self._write_storages(lang)
+            counts['created'] += len(created)
+            counts['updated'] += len(updated)
+            counts['deleted'] += len(deleted)
+        return counts
 
     def delete(self, lang=None):
         r"""
@@ -97,14 +472,54 @@ class Context:
         """
         lang = _get_translate_language(lang)
         if lang != _get_default_language():
-            _get_translations(self.query, lang).delete()
+            using = router.db_for_write(translations.models.Translation)
+            with transaction.atomic(using=using):
+                for query in self._get_purview_queries(
+                    using,
+                    self._get_reserved_params(),
+                ):
+                    _get_translations(query, lang, self.fields).delete()
+            _bump_translations_cache(
+                {(ct_id, lang) for ct_id in self.mapping},
+                using,
+            )
+            for (storage, objs) in self.storages.values():
+                storage.delete(objs, lang, self.fields, self.chunk_size)
+
+    async def acreate(self, lang=None):
+        r"""
+        Create the translations of the `Context`\ 's `purview` in a language
+        (asynchronously).
+        """
+        return await sync_to_async(self.create)(lang)
+
+    async def aread(self, lang=None):
+        r"""
+        Read the translations of the `Context`\ 's `purview` in some
+        language(s) (asynchronously).
+        """
+        return await sync_to_async(self.read)(lang)
+
+    async def aupdate(self, lang=None):
+        r"""
+        Update the translations of the `Context`\ 's `purview` in a language
+        (asynchronously).
+        """
+        return await sync_to_async(self.update)(lang)
+
+    async def adelete(self, lang=None):
+        r"""
+        Delete the translations of the `Context`\ 's `purview` in a language
+        (asynchronously).
+        """
+        return await sync_to_async(self.delete)(lang)
 
     def reset(self):
         r"""
         Reset the translations of the `Context`\ 's `purview` to
         the `default language`.
         """
-        for (ct_id, objs) in self.mapping.items():
-            for (obj_id, obj) in objs.items():
-                for (field, value) in obj._default_translatable_fields.items():
-                    setattr(obj, field, value)
+        for objs in self._get_objects().values():
+            for obj in objs.values():
+                for field in self._get_fields_names(type(obj)):
+                    obj._reset_translated_field(field)
@@ -98,6 +98,32 @@ def _get_translate_language(lang=None):
         return _get_supported_language(lang)
 
 
+def _get_fallback_languages(lang=None):
+    """
+    Return the `supported language` codes of the fallback chain of some
+    translate language code(s).
+    """
+    fallbacks = getattr(settings, 'TRANSLATIONS_FALLBACK_LANGUAGES', {})
+    chain = []
+
+    def _fill_chain(lang):
+        code = _get_translate_language(lang)
+        if code not in chain:
+            chain.append(code)
+            for fallback in fallbacks.get(code, ()):
+                _fill_chain(fallback)
+
+    for x in (lang if isinstance(lang, (list, tuple)) else [lang]):
+        _fill_chain(x)
+
+    # the default language is the source, no need to go any further
+    default = _get_default_language()
+    if default in chain:
+        chain = chain[:chain.index(default)]
+
+    return chain
+
+
 def _get_probe_language(lang=None):
     """
     Return the `supported language` code(s) of some probe language code(s).
@@ -12,6 +12,7 @@ from django.db.models import Q
 from django.contrib.contenttypes.models import ContentType
 
 from translations.models import Translation, Translatable
+from translations.utils import _bump_translations_cache
 
 
 __docformat__ = 'restructuredtext'
@@ -210,6 +211,9 @@ class Command(BaseCommand):
 
             if run_synchronization:
                 obsolete_translations.delete()
+                _bump_translations_cache(
+                    {(content_type.id, None) for content_type in content_types}
+                )
             else:
                 self.stdout.write(
                     'Synchronization cancelled.'
@@ -0,0 +1,36 @@
+"""This module contains the middleware for the Translations app."""
+
+try:
+    from asgiref.sync import iscoroutinefunction
+except ImportError:
+    from asyncio import iscoroutinefunction
+
+from translations.utils import _translations_memo
+
+
+__docformat__ = 'restructuredtext'
+
+
+def memo_middleware(get_response):
+    """
+    Return a middleware which memoizes the translations read in a request.
+    """
+    if iscoroutinefunction(get_response):
+        async def middleware(request):
+            token = _translations_memo.set({})
+            try:
+                return await get_response(request)
+            finally:
+                _translations_memo.reset(token)
+    else:
+        def middleware(request):
+            token = _translations_memo.set({})
+            try:
+                return get_response(request)
+            finally:
+                _translations_memo.reset(token)
+    return middleware
+
+
+memo_middleware.sync_capable = True
+memo_middleware.async_capable = True
@@ -0,0 +1,20 @@
+from django.db import migrations
+
+import translations.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translations', '0002_auto_20180920_1245'),
+    ]
+
+    operations = [
+        # the type of the object ids follows the
+        # `TRANSLATIONS_INTEGER_OBJECT_ID` setting
+        migrations.AlterField(
+            model_name='translation',
+            name='object_id',
+            field=translations.models._get_object_id_field(),
+        ),
+    ]
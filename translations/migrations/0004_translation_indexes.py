@@ -0,0 +1,57 @@
+from django.db import migrations, models
+
+
+# the texts are indexed by a prefix on the backends which allow it, which
+# serves the filters on the fields and the languages too, the others only
+# index the fields and the languages
+TEXT_INDEXES = {
+    'mysql': 'CREATE INDEX translations_text_idx ON {table} '
+             '(content_type_id, field, language, text(64))',
+    'sqlite': 'CREATE INDEX translations_text_idx ON {table} '
+              '(content_type_id, field, language, text)',
+}
+FILTER_INDEX = 'CREATE INDEX translations_filter_idx ON {table} ' \
+               '(content_type_id, field, language)'
+
+
+def get_filter_index_name(schema_editor):
+    if schema_editor.connection.vendor in TEXT_INDEXES:
+        return 'translations_text_idx'
+    return 'translations_filter_idx'
+
+
+def create_filter_index(apps, schema_editor):
+    sql = TEXT_INDEXES.get(schema_editor.connection.vendor, FILTER_INDEX)
+    Translation = apps.get_model('translations', 'Translation')
+    schema_editor.execute(sql.format(
+        table=schema_editor.quote_name(Translation._meta.db_table),
+    ))
+
+
+def delete_filter_index(apps, schema_editor):
+    Translation = apps.get_model('translations', 'Translation')
+    schema_editor.execute(schema_editor.sql_delete_index % {
+        'table': schema_editor.quote_name(Translation._meta.db_table),
+        'name': schema_editor.quote_name(
+            get_filter_index_name(schema_editor)
+        ),
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('translations', '0003_translation_object_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='translation',
+            index=models.Index(
+                fields=['content_type', 'language', 'object_id'],
+                name='translations_read_idx',
+            ),
+        ),
+        migrations.RunPython(create_filter_index, delete_filter_index),
+    ]
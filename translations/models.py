@@ -10,26 +10,43 @@ try:
 except ImportError:
     from django.utils.translation import gettext_lazy as _
 
-from translations.querysets import TranslatableQuerySet
+from translations.querysets import TranslatableQuerySet, \
+    TranslationQuerySet
 
 
 __docformat__ = 'restructuredtext'
 
 
+def _get_object_id_field():
+    """
+    Return the field of the translations' object ids, which is
+    an integer field if the ``TRANSLATIONS_INTEGER_OBJECT_ID`` setting
+    is set.
+    """
+    if getattr(settings, 'TRANSLATIONS_INTEGER_OBJECT_ID', False):
+        return models.BigIntegerField(
+            verbose_name=_('object id'),
+            help_text=_('the id of the object to translate'),
+        )
+    return models.CharField(
+        verbose_name=_('object id'),
+        help_text=_('the id of the object to translate'),
+        max_length=128,
+    )
+
+
 class Translation(models.Model):
     """The model which represents the translations."""
 
+    objects = TranslationQuerySet.as_manager()
+
     content_type = models.ForeignKey(
         verbose_name=_('content type'),
         help_text=_('the content type of the object to translate'),
         to=ContentType,
         on_delete=models.CASCADE,
     )
-    object_id = models.CharField(
-        verbose_name=_('object id'),
-        help_text=_('the id of the object to translate'),
-        max_length=128,
-    )
+    object_id = _get_object_id_field()
     content_object = GenericForeignKey(
         ct_field='content_type',
         fk_field='object_id',
@@ -59,10 +76,108 @@ class Translation(models.Model):
 
     class Meta:
         unique_together = ('content_type', 'object_id', 'field', 'language',)
+        indexes = [
+            # the reads and the presences of the objects in some languages
+            models.Index(
+                fields=['content_type', 'language', 'object_id'],
+                name='translations_read_idx',
+            ),
+            # the filters on the texts of some fields in some languages are
+            # indexed by the migrations, depending on the database
+        ]
         verbose_name = _('translation')
         verbose_name_plural = _('translations')
 
 
+class _TranslatableSnapshot:
+    """
+    The `default language` values of an instance's translatable fields.
+
+    The values are stored by the position of the fields in
+    the model's translatable fields, which are shared between
+    the instances, and the captured and assigned fields are stored as
+    bit masks of those positions.
+    """
+
+    __slots__ = ('values', 'captured', 'dirty')
+
+    def __init__(self, size):
+        """Initialize a `_TranslatableSnapshot` for some fields."""
+        self.values = [None] * size
+        self.captured = 0
+        self.dirty = 0
+
+    def capture(self, index, value):
+        """Keep the value of a field unless it is already kept."""
+        if not self.captured & (1 << index):
+            self.values[index] = value
+            self.captured |= 1 << index
+
+    def release(self, index):
+        """Return the kept value of a field and stop keeping it."""
+        value = self.values[index]
+        self.values[index] = None
+        self.captured &= ~(1 << index)
+        return value
+
+
+class _TranslatableFieldDescriptor:
+    """
+    The descriptor of a translatable field which tracks the assignments of
+    the field (only on the instances which are in a `Context`).
+
+    The other attributes of the instances keep the default path.
+    """
+
+    def __init__(self, descriptor, name, index):
+        """
+        Initialize a `_TranslatableFieldDescriptor` with the descriptor of
+        the field, its name and its position in the translatable fields.
+        """
+        self.descriptor = descriptor
+        self.name = name
+        self.index = index
+
+    def __get__(self, instance, cls=None):
+        """Return the value of the field (loading it if it is deferred)."""
+        if instance is None:
+            return self.descriptor
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            return self.descriptor.__get__(instance, cls)
+
+    def __set__(self, instance, value):
+        """Set the value of the field and track the change."""
+        data = instance.__dict__
+        if '_translatable_snapshot' in data and self.name in data:
+            snapshot = instance._get_translatable_snapshot()
+            snapshot.capture(self.index, data[self.name])
+            snapshot.dirty |= 1 << self.index
+        data[self.name] = value
+
+
+def _contribute_translatable_descriptors(model):
+    """Install the descriptors of a model's translatable fields."""
+    if not issubclass(model, Translatable) or model._meta.abstract:
+        return
+
+    for (index, field) in enumerate(model.get_translatable_fields()):
+        for klass in model.__mro__:
+            if field.attname in klass.__dict__:
+                descriptor = klass.__dict__[field.attname]
+                break
+        else:
+            continue
+        if isinstance(descriptor, _TranslatableFieldDescriptor):
+            descriptor = descriptor.descriptor
+        setattr(model, field.attname, _TranslatableFieldDescriptor(
+            descriptor,
+            field.attname,
+            index,
+        ))
+
+
 class Translatable(models.Model):
     """An abstract model which provides custom translation functionalities."""
     objects = TranslatableQuerySet.as_manager()
@@ -83,6 +198,66 @@ class Translatable(models.Model):
         """
 
         fields = None
+        storage = None
+
+    def _get_translatable_field_index(self, name):
+        """Return the position of a translatable field in the model."""
+        try:
+            return type(self)._get_translatable_fields_names().index(name)
+        except ValueError:
+            return None
+
+    def _get_translatable_snapshot(self):
+        """Return the snapshot of the translatable fields (lazily)."""
+        snapshot = self.__dict__.get('_translatable_snapshot')
+        if snapshot is None:
+            snapshot = _TranslatableSnapshot(
+                len(type(self)._get_translatable_fields_names())
+            )
+            self.__dict__['_translatable_snapshot'] = snapshot
+        return snapshot
+
+    def _get_default_translatable_fields(self):
+        """Return the kept `default language` values of the fields."""
+        snapshot = self.__dict__.get('_translatable_snapshot')
+        if snapshot is None:
+            return {}
+        return {
+            name: snapshot.values[index] for (index, name) in enumerate(
+                type(self)._get_translatable_fields_names()
+            ) if snapshot.captured & (1 << index)
+        }
+
+    def _get_dirty_translatable_fields(self):
+        """Return the names of the assigned translatable fields."""
+        snapshot = self.__dict__.get('_translatable_snapshot')
+        if snapshot is None:
+            return []
+        return [
+            name for (index, name) in enumerate(
+                type(self)._get_translatable_fields_names()
+            ) if snapshot.dirty & (1 << index)
+        ]
+
+    def _set_translated_field(self, name, value):
+        """Set a translatable field to a translation without tracking it."""
+        index = type(self)._get_translatable_fields_names().index(name)
+        snapshot = self._get_translatable_snapshot()
+        mask = 1 << index
+        if not snapshot.captured & mask:
+            snapshot.values[index] = getattr(self, name)
+            snapshot.captured |= mask
+        snapshot.dirty &= ~mask
+        self.__dict__[name] = value
+
+    def _reset_translated_field(self, name):
+        """Reset a translatable field to the `default language` value."""
+        snapshot = self.__dict__.get('_translatable_snapshot')
+        if snapshot is not None:
+            index = self._get_translatable_field_index(name)
+            if snapshot.captured & (1 << index):
+                self.__dict__[name] = snapshot.release(index)
+            snapshot.dirty &= ~(1 << index)
 
     @classmethod
     def get_translatable_fields(cls):
@@ -118,6 +293,14 @@ class Translatable(models.Model):
             ]
         return cls._cached_translatable_fields_names
 
+    @classmethod
+    def _get_translatable_storage(cls):
+        """
+        Return the storage of the model's translations, or `None` if
+        they are stored in the `Translation` model.
+        """
+        return getattr(cls.TranslatableMeta, 'storage', None)
+
     @classmethod
     def _get_translatable_fields_choices(cls):
         """Return the choices of the model's translatable fields."""
@@ -1,23 +1,402 @@
 """This module contains the query utilities for the Translations app."""
 
-import copy
+import functools
 
-from django.db.models import Q
+import django
+from django.core.exceptions import FieldDoesNotExist, FieldError
+from django.db import models
+from django.db.models import Q, F, Exists, OuterRef, Subquery
 from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import Cast, Coalesce
+from django.utils.hashable import make_hashable
+from django.contrib.contenttypes.models import ContentType
 
-from translations.languages import _get_default_language, _get_probe_language
+import translations.models
+from translations.languages import _get_default_language, \
+    _get_fallback_languages, _get_probe_language
 from translations.utils import _get_dissected_lookup
 
 
 __docformat__ = 'restructuredtext'
 
 
+def _get_related_model(model, relation):
+    """Return the model at the end of a relation of a model."""
+    for part in relation:
+        model = model._meta.get_field(part).related_model
+    return model
+
+
+def _get_object_reference(model, relation=()):
+    """
+    Return the reference to the ids of a model's objects (optionally at
+    the end of a relation of the outer query), in the type of
+    the translations' object ids.
+    """
+    object_id = translations.models.Translation._meta.get_field('object_id')
+
+    reference = OuterRef(LOOKUP_SEP.join(list(relation) + ['pk']))
+    if isinstance(object_id, models.CharField) and \
+            not isinstance(model._meta.pk, models.CharField):
+        reference = Cast(reference, output_field=object_id)
+    return reference
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_translations_template(model, content_type_id, field, lang):
+    """
+    Return the translations of a field of a model's objects (of a content
+    type) in some language(s), correlated to the objects (to filter by
+    their texts).
+    """
+    Translation = translations.models.Translation
+
+    # the objects are correlated through their ids
+    reference = _get_object_reference(model)
+
+    lang_supp = (LOOKUP_SEP + 'in') if isinstance(lang, tuple) else ''
+    return Translation.objects.filter(**{
+        'content_type_id': content_type_id,
+        'object_id': reference,
+        'field': field,
+        'language{}'.format(lang_supp): lang,
+    })
+
+
+class _TranslationsExists(Exists):
+    """
+    Check whether the translations of a model's objects match a lookup in
+    some language(s), in a correlated subquery.
+    """
+
+    def __init__(self, model, lookup, lang, value):
+        """
+        Initialize a `_TranslationsExists` with a model, a lookup of one of
+        its translatable fields, some language(s) and a value.
+        """
+        field, _, supplement = lookup.partition(LOOKUP_SEP)
+        field_supp = (LOOKUP_SEP + supplement) if supplement else ''
+
+        self.arguments = (model, lookup, lang, value)
+        super(_TranslationsExists, self).__init__(
+            # the content types are a part of the key, since their ids
+            # change with the database
+            _get_translations_template(
+                model,
+                ContentType.objects.get_for_model(model).id,
+                field,
+                make_hashable(lang),
+            ).filter(**{
+                'text{}'.format(field_supp): value,
+            })
+        )
+
+    def __eq__(self, other):
+        """Compare the `_TranslationsExists` with another by its arguments."""
+        if not isinstance(other, _TranslationsExists):
+            return NotImplemented
+        return self.arguments == other.arguments
+
+    def __hash__(self):
+        """Return the hash of the `_TranslationsExists`."""
+        return hash(make_hashable(self.arguments))
+
+    def __repr__(self):
+        """Return the representation of the `_TranslationsExists`."""
+        return '{}({}, {!r}, {!r}, {!r})'.format(
+            type(self).__name__,
+            self.arguments[0].__name__,
+            *self.arguments[1:]
+        )
+
+
+def _get_translations_texts(model, relation, field, langs):
+    """
+    Return the texts of a field of a model's objects (at the end of
+    a relation of the outer query) in each of some languages.
+    """
+    storage = model._get_translatable_storage()
+    if storage is not None:
+        # the translations are in a field of the rows, whose transforms
+        # only exist from Django 3.1 on, along with the `JSONField`
+        from django.db.models.fields.json import KeyTextTransform, \
+            KeyTransform
+
+        return [
+            KeyTextTransform(
+                field,
+                KeyTransform(x, LOOKUP_SEP.join(relation + [storage.field])),
+            )
+            for x in langs
+        ]
+
+    content_type_id = ContentType.objects.get_for_model(model).id
+    return [
+        Subquery(
+            translations.models.Translation.objects.filter(
+                content_type_id=content_type_id,
+                object_id=_get_object_reference(model, relation),
+                field=field,
+                language=x,
+            ).values('text')[:1]
+        )
+        for x in langs
+    ]
+
+
+def _get_translations_value(model, lookup, lang, fields=None):
+    """
+    Return the value of a lookup of a model's objects, in the texts of some
+    language(s) (falling back to the field itself), or `None` if the lookup
+    is not translatable (optionally in some fields).
+    """
+    try:
+        dissected = _get_dissected_lookup(model, lookup)
+    except (FieldDoesNotExist, FieldError):
+        # the annotations and the invalid names are left to the queryset
+        return None
+    if not dissected['translatable'] or dissected['supplement']:
+        return None
+    if fields is not None and dissected['field'] not in fields:
+        return None
+
+    langs = _get_fallback_languages(lang)
+    if not langs:
+        return None
+
+    relation = dissected['relation']
+    return Coalesce(
+        *_get_translations_texts(
+            _get_related_model(model, relation),
+            relation,
+            dissected['field'],
+            langs,
+        ),
+        F(lookup),
+        output_field=models.TextField(),
+    )
+
+
+def _get_translations_ordering(model, ordering, lang):
+    """
+    Return the ordering of a model's objects by a field name, in the texts
+    of some language(s) if the field is translatable (falling back to
+    the field itself).
+    """
+    if not isinstance(ordering, str) or ordering == '?':
+        return ordering
+
+    descending = ordering.startswith('-')
+    lookup = ordering[1:] if descending else ordering
+    expression = _get_translations_value(model, lookup, lang)
+    if expression is None:
+        return ordering
+    return expression.desc() if descending else expression.asc()
+
+
+def _get_translations_annotation(field):
+    """Return the name of the annotation of a field's translated texts."""
+    return '_translations_text_{}'.format(field)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_annotations_template(model, content_type_id, langs, fields):
+    """
+    Return the annotations of the translated texts of a model's
+    translatable fields (of a content type) in some languages, by their
+    names.
+    """
+    annotations = {}
+    for field in model._get_translatable_fields_names():
+        if fields is not None and field not in fields:
+            continue
+        texts = _get_translations_texts(model, [], field, langs)
+        annotations[_get_translations_annotation(field)] = texts[0] \
+            if len(texts) == 1 else Coalesce(*texts)
+    return annotations
+
+
+def _get_translations_annotations(model, lang, fields=None):
+    """
+    Return the annotations of the translated texts of a model's
+    translatable fields (optionally only some of them) in some language(s),
+    by their names.
+    """
+    langs = _get_fallback_languages(lang)
+    if not langs:
+        return {}
+
+    # the content types are a part of the key, since their ids change with
+    # the database (the expressions are copied when they are resolved)
+    return dict(_get_annotations_template(
+        model,
+        ContentType.objects.get_for_model(model).id,
+        tuple(langs),
+        None if fields is None else tuple(fields),
+    ))
+
+
+def _get_query_shape(children, connector, negated):
+    """
+    Return the shape of a query's children (without their values) and
+    their values.
+    """
+    shapes = []
+    values = []
+    for child in children:
+        if isinstance(child, tuple):
+            shapes.append(('lookup', child[0]))
+            values.append(child[1])
+        elif isinstance(child, Q):
+            shape, nested = _get_query_shape(
+                child.children,
+                child.connector,
+                child.negated,
+            )
+            lang = child.lang if isinstance(child, TQ) else None
+            shapes.append(('query', make_hashable(lang), shape))
+            values.extend(nested)
+        else:
+            shapes.append(('expression',))
+            values.append(child)
+    return ((connector, negated, tuple(shapes)), values)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_lookup_plan(model, lookup, lang, default):
+    """
+    Return the plan to rewrite a lookup of a model in some language(s),
+    as a list of the steps whose results are combined with `|`, or `None`
+    if the lookup is not translatable.
+    """
+    dissected = _get_dissected_lookup(model, lookup)
+    if not dissected['translatable']:
+        return None
+
+    if isinstance(lang, tuple):
+        query_default = default in lang
+        query_languages = [x for x in lang if x != default]
+    else:
+        query_default = lang == default
+        query_languages = None if query_default else lang
+
+    steps = []
+    if query_default:
+        steps.append(('lookup', lookup))
+
+    target = _get_related_model(model, dissected['relation'])
+    storage = target._get_translatable_storage()
+    supplement = [dissected['supplement']] if dissected['supplement'] else []
+
+    if query_languages and storage is not None:
+        # the translations are in a field of the rows
+        if not isinstance(query_languages, list):
+            query_languages = [query_languages]
+        for x in query_languages:
+            steps.append(('lookup', LOOKUP_SEP.join(
+                dissected['relation'] +
+                [storage.field, x, dissected['field']] +
+                supplement
+            )))
+    elif query_languages:
+        # the translations are looked up in subqueries, so the objects are
+        # never multiplied by them
+        steps.append((
+            'exists',
+            target,
+            LOOKUP_SEP.join([dissected['field']] + supplement),
+            query_languages,
+            LOOKUP_SEP.join(dissected['relation'] + ['in'])
+            if dissected['relation'] else None,
+        ))
+    return steps
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_query_plan(model, lang, default, shape):
+    """
+    Return the plan to rewrite the queries of a shape of a model in some
+    language(s).
+    """
+    (connector, negated, shapes) = shape
+    plans = []
+    for child in shapes:
+        if child[0] == 'lookup':
+            plans.append(('lookup', child[1], _get_lookup_plan(
+                model, child[1], lang, default,
+            )))
+        elif child[0] == 'query':
+            plans.append(('query', _get_query_plan(
+                model, child[1] or lang, default, child[2],
+            )))
+        else:
+            plans.append(child)
+    return (connector, negated, plans)
+
+
+def _apply_query_plan(plan, values):
+    """Return the query of a plan filled with some values (in order)."""
+    (connector, negated, plans) = plan
+    children = []
+    for child in plans:
+        if child[0] == 'lookup':
+            value = next(values)
+            if child[2] is None:
+                q = Q(**{child[1]: value})
+            else:
+                q = Q()
+                for step in child[2]:
+                    if step[0] == 'lookup':
+                        q |= Q(**{step[1]: value})
+                    else:
+                        (kind, target, lookup, languages, relation) = step
+                        exists = _TranslationsExists(
+                            target, lookup, languages, value,
+                        )
+                        if django.VERSION < (3, 0):
+                            # the expressions are only filtered as
+                            # annotations before Django 3.0
+                            q |= Q(**{
+                                relation or 'pk__in':
+                                target._base_manager.annotate(
+                                    _translations_exists=exists,
+                                ).filter(_translations_exists=True)
+                            })
+                        elif relation:
+                            q |= Q(**{
+                                relation: target._base_manager.filter(exists)
+                            })
+                        else:
+                            q |= Q(exists)
+        elif child[0] == 'query':
+            q = _apply_query_plan(child[1], values)
+        else:
+            # the expressions (like `Exists`) are kept as they are
+            q = next(values)
+        children.append(q)
+    return Q(*children, _connector=connector, _negated=negated)
+
+
+def _clear_query_plans(setting=None, **kwargs):
+    """
+    Clear the memoized lookups and query plans (when the models or
+    the installed apps change).
+    """
+    if setting in (None, 'INSTALLED_APPS'):
+        _get_dissected_lookup.cache_clear()
+        _get_lookup_plan.cache_clear()
+        _get_query_plan.cache_clear()
+        _get_translations_template.cache_clear()
+        _get_annotations_template.cache_clear()
+
+
 def _fetch_translations_query_getter(model, lang):
     """
     Return the translations query getter specialized for a model and some
     language(s).
     """
     default = _get_default_language()
+    lang = make_hashable(lang)
 
     def _get_translations_query(*args, **kwargs):
         connector = kwargs.pop('_connector', None)
@@ -25,103 +404,63 @@ def _fetch_translations_query_getter(model, lang):
 
         children = list(args) + sorted(kwargs.items())
 
-        for index, child in enumerate(children):
-            if isinstance(child, tuple):
-                dissected = _get_dissected_lookup(model, child[0])
-                if dissected['translatable']:
-                    query_default = False
-                    query_languages = None
-                    if isinstance(lang, (list, tuple)):
-                        query_languages = []
-                        for x in lang:
-                            if x == default:
-                                query_default = True
-                            else:
-                                query_languages.append(x)
-                    else:
-                        if lang == default:
-                            query_default = True
-                            query_languages = None
-                        else:
-                            query_default = False
-                            query_languages = lang
-
-                    q = Q()
-
-                    if query_default:
-                        q |= Q(**{child[0]: child[1]})
-
-                    if query_languages:
-                        relation = LOOKUP_SEP.join(
-                            dissected['relation'] + ['translations'])
-                        field_supp = (LOOKUP_SEP + dissected['supplement']) \
-                            if dissected['supplement'] else ''
-                        lang_supp = (LOOKUP_SEP + 'in') \
-                            if isinstance(query_languages, (list, tuple)) \
-                            else ''
-
-                        q |= Q(**{
-                            '{}__field'.format(relation):
-                                dissected['field'],
-                            '{}__text{}'.format(relation, field_supp):
-                                child[1],
-                            '{}__language{}'.format(relation, lang_supp):
-                                query_languages
-                        })
-                else:
-                    q = Q(**{child[0]: child[1]})
-            elif isinstance(child, TQ):
-                if child.lang:
-                    getter = _fetch_translations_query_getter(
-                        model,
-                        child.lang
-                    )
-                    q = getter(
-                        *child.children,
-                        _connector=child.connector,
-                        _negated=child.negated
-                    )
-                else:
-                    q = _get_translations_query(
-                        *child.children,
-                        _connector=child.connector,
-                        _negated=child.negated
-                    )
-            elif isinstance(child, Q):
-                q = _get_translations_query(
-                    *child.children,
-                    _connector=child.connector,
-                    _negated=child.negated
-                )
-            children[index] = q
-
-        query = Q(*children, _connector=connector, _negated=negated)
-
-        return query
+        # the plans of the same shapes are reused, only the values differ
+        shape, values = _get_query_shape(children, connector, negated)
+        plan = _get_query_plan(model, lang, default, shape)
+        return _apply_query_plan(plan, iter(values))
 
     return _get_translations_query
 
 
+def _get_q_copy(q):
+    """Return a shallow copy of a `Q` object, sharing its children."""
+    # `Node.create` replaced `Node._new_instance` in Django 4.2
+    cls = type(q)
+    create = getattr(cls, 'create', None) or cls._new_instance
+    obj = create(connector=q.connector, negated=q.negated)
+    obj.children = q.children
+    return obj
+
+
 class TQ(Q):
     """
     Encapsulate translation queries as objects that can then be combined
     logically (using `&` and `|`).
+
+    A `TQ` is never changed in place, specializing and combining it return
+    new nodes which share its children.
     """
 
+    lang = None
+
     def __init__(self, *args, **kwargs):
         """Initialize a `TQ` with `Q` arguments."""
         super(TQ, self).__init__(*args, **kwargs)
         self.lang = None
 
+    def __copy__(self):
+        """Return a shallow copy of the `TQ` object, sharing its children."""
+        obj = _get_q_copy(self)
+        obj.lang = self.lang
+        return obj
+
+    copy = __copy__
+
     def __deepcopy__(self, memodict):
         """Return a copy of the `TQ` object."""
         obj = super(TQ, self).__deepcopy__(memodict)
         obj.lang = self.lang
         return obj
 
+    def __invert__(self):
+        """Return the negation of the `TQ` object, sharing its children."""
+        obj = self.copy()
+        obj.negate()
+        return obj
+
     def __call__(self, lang=None):
         """Specialize the `TQ` for some language(s)."""
-        obj = copy.deepcopy(self)
+        obj = self.copy()
         obj.lang = _get_probe_language(lang)
         return obj
 
@@ -132,10 +471,11 @@ class TQ(Q):
 
         # If the other Q() is empty, ignore it and just use `self`.
         if not other:
-            return copy.deepcopy(self)
+            return self.copy()
         # Or if this Q is empty, ignore it and just use `other`.
         elif not self:
-            return copy.deepcopy(other)
+            return other.copy() if isinstance(other, TQ) else \
+                _get_q_copy(other)
 
         obj = Q(self, other, _connector=conn)
         return obj
@@ -1,11 +1,27 @@
 """This module contains the querysets for the Translations app."""
 
+import itertools
+
+try:
+    from asgiref.sync import sync_to_async
+except ImportError:
+    # the async methods need Django 4.1, which comes with asgiref
+    sync_to_async = None
+
+import django
+from django.db import connections, NotSupportedError
 from django.db.models import query
+from django.contrib.contenttypes.models import ContentType
 
+import translations.models
 from translations.languages import _get_default_language, \
-    _get_translate_language, _get_probe_language
-from translations.query import _fetch_translations_query_getter
+    _get_translate_language, _get_fallback_languages, _get_probe_language
+from translations.query import _fetch_translations_query_getter, \
+    _get_translations_value, _get_translations_ordering, \
+    _get_translations_annotation, _get_translations_annotations
 from translations.context import Context
+from translations.utils import _get_translations_cache, \
+    _bump_translations_cache
 
 
 __docformat__ = 'restructuredtext'
@@ -20,6 +36,9 @@ class TranslatableQuerySet(query.QuerySet):
         self._trans_lang = _get_default_language()
         self._trans_prob = _get_default_language()
         self._trans_rels = ()
+        self._trans_fields = None
+        self._trans_order = None
+        self._trans_inline = False
         self._trans_cache = False
 
     def _chain(self, **kwargs):
@@ -30,36 +49,284 @@ class TranslatableQuerySet(query.QuerySet):
         clone._trans_lang = getattr(self, '_trans_lang')
         clone._trans_prob = getattr(self, '_trans_prob')
         clone._trans_rels = getattr(self, '_trans_rels')
+        clone._trans_fields = getattr(self, '_trans_fields')
+        clone._trans_order = getattr(self, '_trans_order')
+        clone._trans_inline = getattr(self, '_trans_inline')
 
         # reset cache on chaining
         clone._trans_cache = False
 
         return clone
 
+    def _get_inline_query(self):
+        """
+        Return the `TranslatableQuerySet` which selects the translated texts
+        of its objects in the main query, and the names of its annotations
+        by the fields.
+        """
+        annotations = _get_translations_annotations(
+            self.model,
+            self._trans_lang,
+            self._trans_fields,
+        )
+        names = {
+            field: _get_translations_annotation(field)
+            for field in self.model._get_translatable_fields_names()
+            if _get_translations_annotation(field) in annotations
+        }
+        return self.annotate(**annotations), names
+
+    def _get_inline_objects(self, objs, names):
+        """
+        Yield some objects fetched by the inline query, translated in
+        the texts of their annotations.
+        """
+        for obj in objs:
+            obj.__dict__.setdefault('_translatable_snapshot', None)
+            for (field, name) in names.items():
+                text = obj.__dict__.pop(name)
+                if text is not None:
+                    obj._set_translated_field(field, text)
+            yield obj
+
+    def _fetch_inline(self):
+        """
+        Evaluate the `TranslatableQuerySet` with the translated texts of its
+        objects in the main query, and return the translated objects.
+        """
+        clone, names = self._get_inline_query()
+        self._result_cache = list(self._get_inline_objects(
+            self._iterable_class(clone),
+            names,
+        ))
+        return self._result_cache
+
+    def _get_values_query(self):
+        """
+        Return the `TranslatableQuerySet` which selects the translated texts
+        of its values in the main query, the names of its values and
+        the aliases of the translated values by their names, or `None` if
+        none of the values are translatable.
+        """
+        # the grouped and the combined queries are kept as they are
+        if self.query.group_by or self.query.combinator:
+            return None
+
+        clone = self._chain()
+        aliases = {}
+        for name in self.query.values_select:
+            expression = _get_translations_value(
+                self.model,
+                name,
+                self._trans_lang,
+                self._trans_fields,
+            )
+            if expression is not None:
+                aliases[name] = _get_translations_annotation(len(aliases))
+                clone.query.add_annotation(expression, aliases[name])
+        if not aliases:
+            return None
+
+        # the translated fields are selected in the places of the fields
+        names = self._fields or (
+            *self.query.extra_select,
+            *self.query.values_select,
+            *self.query.annotation_select,
+        )
+        clone._fields = tuple(aliases.get(x, x) for x in names)
+        clone.query.set_values(clone._fields)
+        if self._iterable_class is query.NamedValuesListIterable:
+            clone._iterable_class = query.ValuesListIterable
+        return clone, names, aliases
+
+    def _get_values_rows(self, rows, names, aliases):
+        """
+        Yield some rows fetched by the values query, under the names of
+        the values.
+        """
+        if self._iterable_class is query.ValuesIterable:
+            for row in rows:
+                yield {x: row[aliases.get(x, x)] for x in names}
+        elif self._iterable_class is query.NamedValuesListIterable:
+            # `create_namedtuple_class` left the iterable in Django 3.2
+            create = getattr(query, 'create_namedtuple_class', None) or \
+                query.NamedValuesListIterable.create_namedtuple_class
+            tuple_class = create(*names)
+            for row in rows:
+                yield tuple.__new__(tuple_class, row)
+        else:
+            yield from rows
+
+    def _fetch_values(self):
+        """
+        Evaluate the `TranslatableQuerySet` as values (dicts or tuples) with
+        the translated texts in the main query, and return them.
+        """
+        values = self._get_values_query()
+        if values is None:
+            return list(self._iterable_class(self))
+
+        clone, names, aliases = values
+        return list(self._get_values_rows(
+            clone._iterable_class(clone),
+            names,
+            aliases,
+        ))
+
+    def _read_translations(self, objs, inlined=False):
+        """
+        Read the translations of some objects of the `TranslatableQuerySet`
+        and their relations (only the relations if the objects are
+        inlined).
+        """
+        if inlined and not self._trans_rels:
+            return
+
+        with Context(
+            objs,
+            *self._trans_rels,
+            fields=self._trans_fields
+        ) as context:
+            if inlined:
+                # the inlined objects are already translated
+                ct_id = ContentType.objects.get_for_model(self.model).id
+                mapping = context.mapping.get(ct_id, {})
+                object_id = translations.models.Translation._meta.get_field(
+                    'object_id'
+                ).to_python
+                for obj in objs:
+                    if mapping.get(object_id(obj.pk)) is obj:
+                        del mapping[object_id(obj.pk)]
+                if not mapping:
+                    context.mapping.pop(ct_id, None)
+            context.read(self._trans_lang)
+
+    def _is_inline(self):
+        """Return whether the `TranslatableQuerySet` is translated inline."""
+        # the combined queries cannot be annotated, they are read instead
+        return self._trans_inline and not self.query.combinator and \
+            self.model._get_translatable_storage() is None
+
     def _fetch_all(self):
         """Evaluate the `TranslatableQuerySet`."""
+        langs = _get_fallback_languages(self._trans_lang)
+
+        inlined = False
+        if self._result_cache is None and langs:
+            if self._iterable_class is not query.ModelIterable:
+                self._result_cache = self._fetch_values()
+            elif self._is_inline():
+                inlined = bool(self._fetch_inline())
+
         super(TranslatableQuerySet, self)._fetch_all()
 
-        if self._trans_lang == _get_default_language():
+        # the values are translated in the main query
+        if not langs or self._iterable_class is not query.ModelIterable:
+            return
+
+        if not self._trans_cache:
+            self._read_translations(self._result_cache, inlined)
+            self._trans_cache = True
+
+    def _iterator(self, use_chunked_fetch, chunk_size):
+        """
+        Iterate the `TranslatableQuerySet`, translating it chunk by chunk.
+        """
+        langs = _get_fallback_languages(self._trans_lang)
+        if not langs:
+            yield from super(TranslatableQuerySet, self)._iterator(
+                use_chunked_fetch, chunk_size,
+            )
             return
 
         if self._iterable_class is not query.ModelIterable:
-            raise TypeError(
-                'Translations does not support custom iteration (yet). ' +
-                'e.g. values, values_list, etc. ' +
-                'If necessary you can `decipher` and then do it.'
+            values = self._get_values_query()
+            if values is None:
+                yield from super(TranslatableQuerySet, self)._iterator(
+                    use_chunked_fetch, chunk_size,
+                )
+            else:
+                clone, names, aliases = values
+                yield from self._get_values_rows(
+                    super(TranslatableQuerySet, clone)._iterator(
+                        use_chunked_fetch, chunk_size,
+                    ),
+                    names,
+                    aliases,
+                )
+            return
+
+        inlined = self._is_inline()
+        if inlined:
+            clone, names = self._get_inline_query()
+            objs = self._get_inline_objects(
+                super(TranslatableQuerySet, clone)._iterator(
+                    use_chunked_fetch, chunk_size,
+                ),
+                names,
+            )
+        else:
+            objs = super(TranslatableQuerySet, self)._iterator(
+                use_chunked_fetch, chunk_size,
             )
 
-        if not self._trans_cache:
-            with Context(self._result_cache, *self._trans_rels) \
-                    as context:
-                context.read(self._trans_lang)
-            self._trans_cache = True
+        # the chunks are as large as the fetched ones (2000 by default, as
+        # in django), so only one of them is kept in the memory
+        size = chunk_size or 2000
+        while True:
+            chunk = list(itertools.islice(objs, size))
+            if not chunk:
+                return
+            self._read_translations(chunk, inlined)
+            yield from chunk
+
+    async def aiterator(self, chunk_size=2000):
+        """
+        Iterate the `TranslatableQuerySet` asynchronously, translating it
+        chunk by chunk.
+        """
+        if self._prefetch_related_lookups and django.VERSION < (5, 0):
+            # as in django, which prefetches in the chunks from 5.0 on
+            raise NotSupportedError(
+                'Using QuerySet.aiterator() after prefetch_related() ' +
+                'is not supported.'
+            )
+        if chunk_size <= 0:
+            raise ValueError('Chunk size must be strictly positive.')
+        use_chunked_fetch = not connections[self.db].settings_dict.get(
+            'DISABLE_SERVER_SIDE_CURSORS'
+        )
+
+        # each chunk is fetched, prefetched and translated in one sync call
+        objs = self._iterator(use_chunked_fetch, chunk_size)
 
-    def translate(self, lang=None):
-        """Translate the `TranslatableQuerySet` in a language."""
+        def _get_chunk():
+            return list(itertools.islice(objs, chunk_size))
+
+        while True:
+            chunk = await sync_to_async(_get_chunk)()
+            for obj in chunk:
+                yield obj
+            if len(chunk) < chunk_size:
+                break
+
+    def translate(self, lang=None, fields=None, inline=False):
+        """
+        Translate the `TranslatableQuerySet` in some language(s)
+        (optionally only some fields, optionally in the main query).
+        """
         clone = self.all()
-        clone._trans_lang = _get_translate_language(lang)
+        if isinstance(lang, (list, tuple)):
+            clone._trans_lang = [_get_translate_language(x) for x in lang]
+        else:
+            clone._trans_lang = _get_translate_language(lang)
+        clone._trans_fields = None if fields is None else tuple(fields)
+        clone._trans_inline = inline
+        sliced = clone.query.low_mark or clone.query.high_mark is not None
+        if clone._trans_order is not None and not sliced:
+            # the ordering follows the new language(s), unless a slice has
+            # been taken in the old one
+            clone = clone.order_by(*clone._trans_order)
         return clone
 
     def translate_related(self, *fields):
@@ -74,6 +341,21 @@ class TranslatableQuerySet(query.QuerySet):
         clone._trans_prob = _get_probe_language(lang)
         return clone
 
+    def order_by(self, *field_names):
+        """
+        Order the `TranslatableQuerySet` (by the translated texts of
+        the translatable fields).
+        """
+        if self.query.combinator:
+            return super(TranslatableQuerySet, self).order_by(*field_names)
+
+        clone = super(TranslatableQuerySet, self).order_by(*[
+            _get_translations_ordering(self.model, x, self._trans_lang)
+            for x in field_names
+        ])
+        clone._trans_order = field_names
+        return clone
+
     def filter(self, *args, **kwargs):
         """Filter the `TranslatableQuerySet`."""
         if not (args or kwargs):
@@ -95,3 +377,57 @@ class TranslatableQuerySet(query.QuerySet):
             self._trans_prob
         )(*args, **kwargs)
         return super(TranslatableQuerySet, self).exclude(query)
+
+
+class TranslationQuerySet(query.QuerySet):
+    """
+    A queryset which keeps the cached translations up to date in
+    the writes which send no signals.
+    """
+
+    def _get_cached_pairs(self):
+        r"""
+        Return the content types and languages of the `TranslationQuerySet`
+        (only if the translations are cached).
+        """
+        if _get_translations_cache() is None:
+            return set()
+        return set(
+            self.order_by().values_list(
+                'content_type_id', 'language',
+            ).distinct()
+        )
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """Create some translations in bulk."""
+        objs = list(objs)
+        created = super(TranslationQuerySet, self).bulk_create(
+            objs, *args, **kwargs
+        )
+        _bump_translations_cache(
+            {(obj.content_type_id, obj.language) for obj in objs},
+            self.db,
+        )
+        return created
+
+    def update(self, **kwargs):
+        """
+        Update the translations of the `TranslationQuerySet` (also used by
+        `bulk_update`).
+        """
+        pairs = self._get_cached_pairs()
+        updated = super(TranslationQuerySet, self).update(**kwargs)
+        if {'content_type', 'content_type_id', 'language'} & set(kwargs):
+            # the moved translations are cached in other languages (or
+            # content types) too, which is rare enough to bump them all
+            content_types = {ct_id for (ct_id, lang) in pairs}
+            content_type = kwargs.get(
+                'content_type',
+                kwargs.get('content_type_id'),
+            )
+            content_type = getattr(content_type, 'pk', content_type)
+            if isinstance(content_type, int):
+                content_types.add(content_type)
+            pairs = {(ct_id, None) for ct_id in content_types}
+        _bump_translations_cache(pairs, self.db)
+        return updated
@@ -0,0 +1,174 @@
+"""This module contains the storages for the Translations app."""
+
+from django.db import router, transaction
+
+
+__docformat__ = 'restructuredtext'
+
+
+class JSONStorage:
+    """
+    A storage which keeps the translations of an object in a JSON field of
+    the object itself, as ``{language: {field: text}}``.
+    """
+
+    def __init__(self, field):
+        """Initialize a `JSONStorage` with the name of a JSON field."""
+        self.field = field
+
+    def _get_data(self, obj):
+        """Return the translations of an object in the storage."""
+        return getattr(obj, self.field) or {}
+
+    def read(self, content_type_id, objs, langs, fields=None):
+        """
+        Return the translations of some objects in some languages
+        (optionally in some fields), as (content_type_id, object_id, field,
+        text, language).
+        """
+        return [
+            (content_type_id, obj_id, field, text, lang)
+            for (obj_id, obj) in objs.items()
+            for lang in langs
+            for (field, text) in self._get_data(obj).get(lang, {}).items()
+            if fields is None or field in fields
+        ]
+
+    def write(self, objs, lang, changed, cleared, batch_size=None):
+        """
+        Write the changed and the cleared fields of some objects in
+        a language, as (object_id, field, text) and (object_id, field).
+        """
+        # the objects are checked against their own copies first, so writing
+        # the unchanged objects costs no queries
+        copies = {
+            obj_id: self._copy_data(objs[obj_id])
+            for obj_id in {item[0] for item in changed + cleared}
+        }
+        if not self._merge(copies, lang, changed, cleared)[1]:
+            return {'created': 0, 'updated': 0, 'deleted': 0}
+
+        using = router.db_for_write(type(next(iter(objs.values()))))
+        with transaction.atomic(using=using):
+            data = self._lock_data(objs, copies, using, batch_size)
+            counts, touched = self._merge(
+                data,
+                lang,
+                [item for item in changed if item[0] in data],
+                [item for item in cleared if item[0] in data],
+            )
+            self._save(
+                objs,
+                {obj_id: data[obj_id] for obj_id in touched},
+                using,
+                batch_size,
+            )
+        return counts
+
+    def delete(self, objs, lang, fields=None, batch_size=None):
+        """
+        Delete the translations of some objects in a language
+        (optionally in some fields).
+        """
+        obj_ids = [
+            obj_id for (obj_id, obj) in objs.items()
+            if self._get_data(obj).get(lang)
+        ]
+        if not obj_ids:
+            return
+
+        using = router.db_for_write(type(objs[obj_ids[0]]))
+        with transaction.atomic(using=using):
+            data = self._lock_data(objs, obj_ids, using, batch_size)
+            touched = set()
+            for (obj_id, translations) in data.items():
+                translated = translations.get(lang)
+                if not translated:
+                    continue
+                if fields is None:
+                    del translations[lang]
+                    touched.add(obj_id)
+                else:
+                    for field in fields:
+                        if field in translated:
+                            del translated[field]
+                            touched.add(obj_id)
+            self._save(
+                objs,
+                {obj_id: data[obj_id] for obj_id in touched},
+                using,
+                batch_size,
+            )
+
+    def _copy_data(self, obj):
+        """Return a copy of the translations of an object to change."""
+        return {
+            lang: dict(translated)
+            for (lang, translated) in self._get_data(obj).items()
+        }
+
+    def _merge(self, data, lang, changed, cleared):
+        """
+        Merge the changed and the cleared fields of some objects into their
+        translations in a language, return the counts and the changed ids.
+        """
+        counts = {'created': 0, 'updated': 0, 'deleted': 0}
+        touched = set()
+        for (obj_id, field, text) in changed:
+            translated = data[obj_id].setdefault(lang, {})
+            if field not in translated:
+                counts['created'] += 1
+            elif translated[field] != text:
+                counts['updated'] += 1
+            else:
+                continue
+            translated[field] = text
+            touched.add(obj_id)
+        for (obj_id, field) in cleared:
+            translated = data[obj_id].get(lang, {})
+            if field in translated:
+                counts['deleted'] += 1
+                del translated[field]
+                touched.add(obj_id)
+        return counts, touched
+
+    def _lock_data(self, objs, obj_ids, using, batch_size=None):
+        """
+        Return a copy of the stored translations of some objects to change,
+        locking their rows until the end of the transaction.
+        """
+        # the translations are re-read from the database, so the languages
+        # written by others since the objects were fetched are not lost
+        obj_ids = {objs[obj_id].pk: obj_id for obj_id in obj_ids}
+        pks = list(obj_ids)
+        size = batch_size or len(pks)
+        queryset = type(objs[obj_ids[pks[0]]])._base_manager.using(
+            using
+        ).select_for_update()
+        data = {}
+        for start in range(0, len(pks), size):
+            for (pk, translations) in queryset.filter(
+                pk__in=pks[start:start + size]
+            ).values_list('pk', self.field):
+                data[obj_ids[pk]] = {
+                    lang: dict(translated)
+                    for (lang, translated) in (translations or {}).items()
+                }
+        return data
+
+    def _save(self, objs, data, using, batch_size=None):
+        """Save the changed translations of some objects."""
+        changed = []
+        for (obj_id, translations) in data.items():
+            obj = objs[obj_id]
+            # the empty languages are dropped
+            obj.__dict__[self.field] = {
+                lang: translated
+                for (lang, translated) in translations.items()
+                if translated
+            }
+            changed.append(obj)
+        if changed:
+            type(changed[0])._base_manager.using(using).bulk_update(
+                changed, [self.field], batch_size=batch_size
+            )
@@ -1,13 +1,21 @@
 """This module contains the utilities for the Translations app."""
 
-from django.db import models
+import contextvars
+import functools
+import time
+
+from django.db import models, transaction
 from django.db.models.query import prefetch_related_objects
+from django.db.models.signals import post_save, post_delete
 from django.db.models.constants import LOOKUP_SEP
+from django.conf import settings
+from django.core.cache import caches
 from django.core.exceptions import FieldError
 from django.contrib.contenttypes.models import ContentType
 from django.utils.functional import SimpleLazyObject
 
 import translations.models
+from translations.languages import _get_all_languages
 
 
 __docformat__ = 'restructuredtext'
@@ -37,8 +45,12 @@ def _get_reverse_relation(model, relation):
         return reverse_relation
 
 
+@functools.lru_cache(maxsize=1024)
 def _get_dissected_lookup(model, lookup):
-    """Return the dissected info of a lookup."""
+    """
+    Return the dissected info of a lookup (memoized, so it must not be
+    changed).
+    """
     dissected = {
         'relation': [],
         'field': '',
@@ -139,73 +151,175 @@ def _get_entity_details(entity):
     return (iterable, model)
 
 
-def _get_purview(entity, hierarchy):
-    """Return the purview of an entity and a relations hierarchy of it."""
+def _prefetch_relation(objs, relation):
+    """Prefetch a relation of some objects which is not fetched yet."""
+    # the reverse relations are accessed by their accessor names
+    # (e.g. `city_set`), which may differ from their field names
+    for field in type(objs[0])._meta.get_fields():
+        if field.auto_created and not field.concrete:
+            name = field.get_accessor_name()
+        else:
+            name = field.name
+        if name == relation:
+            break
+    else:
+        return
+
+    if not field.is_relation:
+        return
+
+    if field.many_to_many or field.one_to_many:
+        unfetched = [
+            obj for obj in objs if not (
+                hasattr(obj, '_prefetched_objects_cache') and
+                relation in obj._prefetched_objects_cache
+            )
+        ]
+    else:
+        unfetched = [obj for obj in objs if not field.is_cached(obj)]
+
+    if unfetched:
+        prefetch_related_objects(unfetched, relation)
+
+
+def _get_purview(entity, hierarchy, fields=None):
+    """
+    Return the purview of an entity and a relations hierarchy of it
+    (optionally in some fields).
+    """
     mapping = {}
-    query = models.Q()
 
     def _fill_entity(entity, hierarchy, included=True):
         iterable, model = _get_entity_details(entity)
 
         if model is None:
-            return
+            return []
 
-        content_type_id = ContentType.objects.get_for_model(model).id
+        objs = list(entity) if iterable else [entity]
 
         if included:
-            instances = mapping.setdefault(content_type_id, {})
             if not issubclass(model, translations.models.Translatable):
                 raise TypeError('`{}` is not Translatable!'.format(model))
 
-        def _fill_obj(obj):
-            if included:
-                if not hasattr(obj, '_default_translatable_fields'):
-                    obj._default_translatable_fields = {
-                        field: getattr(obj, field) for field in
-                        type(obj)._get_translatable_fields_names()
-                    }
-                object_id = str(obj.pk)
-                instances[object_id] = obj
-                nonlocal query
-                query |= models.Q(
-                    content_type__id=content_type_id,
-                    object_id=object_id,
-                )
+            content_type_id = ContentType.objects.get_for_model(model).id
+            instances = mapping.setdefault(content_type_id, {})
 
-            if hierarchy:
-                for (relation, detail) in hierarchy.items():
-                    value = getattr(obj, relation, None)
-
-                    if value is not None:
-                        if isinstance(value, models.Manager):
-                            if not (
-                                hasattr(obj, '_prefetched_objects_cache') and
-                                relation in obj._prefetched_objects_cache
-                            ):
-                                prefetch_related_objects([obj], relation)
-                            value = value.all()
-                        _fill_entity(
-                            entity=value,
-                            hierarchy=detail['relations'],
-                            included=detail['included'],
-                        )
+            names = [
+                field for field in model._get_translatable_fields_names()
+                if fields is None or field in fields
+            ]
+            storage = model._get_translatable_storage()
+            if storage is not None:
+                # the translations are read from the objects themselves
+                names.append(storage.field)
+            # the ids are kept in the type of the translations' object ids
+            object_id = translations.models.Translation._meta.get_field(
+                'object_id'
+            ).to_python
+            for obj in objs:
+                # the default values are kept once the fields change,
+                # the snapshot is created on the first change
+                obj.__dict__.setdefault('_translatable_snapshot', None)
+                deferred = [
+                    field for field in names if field not in obj.__dict__
+                ]
+                if deferred:
+                    obj.refresh_from_db(fields=deferred)
+                instances[object_id(obj.pk)] = obj
+
+        branches = []
+        for (relation, detail) in hierarchy.items():
+            _prefetch_relation(objs, relation)
+
+            values = {}
+            for obj in objs:
+                value = getattr(obj, relation, None)
+
+                if value is not None:
+                    if isinstance(value, models.Manager):
+                        for item in value.all():
+                            values.setdefault(type(item), []).append(item)
+                    else:
+                        values.setdefault(type(value), []).append(value)
 
-        if iterable:
-            for obj in entity:
-                _fill_obj(obj)
-        else:
-            _fill_obj(entity)
+            for value in values.values():
+                branches.append(
+                    (value, detail['relations'], detail['included'])
+                )
 
-    _fill_entity(entity, hierarchy)
+        return branches
+
+    # walk the hierarchy level by level, so that each relation is
+    # prefetched once for all the objects in its level
+    level = [(entity, hierarchy, True)]
+    while level:
+        level = [
+            branch
+            for (entity, hierarchy, included) in level
+            for branch in _fill_entity(entity, hierarchy, included)
+        ]
+
+    query = _get_grouped_query(
+        ({'content_type__id': ct_id}, list(objs))
+        for (ct_id, objs) in mapping.items()
+    )
 
     return mapping, query
 
 
-def _get_translations(query, lang):
-    """Return the `Translation` queryset of a query in a language."""
+def _get_grouped_query(groups):
+    """Return the query of some object ids grouped by some lookups."""
+    return models.Q(
+        *[
+            models.Q(object_id__in=object_ids, **lookups)
+            for (lookups, object_ids) in groups
+        ],
+        _connector=models.Q.OR
+    )
+
+
+def _get_chunked_groups(groups, size=None):
+    """Yield the chunks of some grouped object ids in a size."""
+    if size is None:
+        groups = [group for group in groups if group[1]]
+        if groups:
+            yield groups
+        return
+
+    chunk = []
+    count = 0
+    for (lookups, object_ids) in groups:
+        object_ids = list(object_ids)
+        while object_ids:
+            room = size - count - len(lookups)
+            if room < 1 and chunk:
+                yield chunk
+                chunk = []
+                count = 0
+                continue
+            room = max(room, 1)
+            chunk.append((lookups, object_ids[:room]))
+            count += len(lookups) + len(object_ids[:room])
+            object_ids = object_ids[room:]
+    if chunk:
+        yield chunk
+
+
+def _get_translations(query, lang, fields=None):
+    """
+    Return the `Translation` queryset of a query in some language(s)
+    (optionally in some fields).
+    """
     if (query):
+        lookups = {}
+        if isinstance(lang, (list, tuple)):
+            lookups['language__in'] = lang
+        else:
+            lookups['language'] = lang
+        if fields is not None:
+            lookups['field__in'] = fields
         queryset = translations.models.Translation.objects.filter(
-            language=lang,
+            **lookups
         ).filter(
             query,
         ).select_related('content_type')
@@ -213,3 +327,297 @@ def _get_translations(query, lang):
         return queryset
     else:
         return translations.models.Translation.objects.none()
+
+
+_translations_memo = contextvars.ContextVar(
+    'translations_memo',
+    default=None,
+)
+
+
+class _TranslationsMemo:
+    """An in-process memo of the translations in front of a cache."""
+
+    def __init__(self, memo, cache=None):
+        """Initialize a `_TranslationsMemo` with a memo and a cache."""
+        self.memo = memo
+        self.cache = cache
+
+    def get_many(self, keys):
+        """Return the memoized (or cached) values of some keys."""
+        values = {key: self.memo[key] for key in keys if key in self.memo}
+        if self.cache is not None and len(values) < len(keys):
+            cached = self.cache.get_many(
+                [key for key in keys if key not in values]
+            )
+            self.memo.update(cached)
+            values.update(cached)
+        return values
+
+    def set_many(self, data):
+        """Memoize (and cache) the values of some keys."""
+        self.memo.update(data)
+        if self.cache is not None:
+            self.cache.set_many(data)
+
+    def delete_many(self, keys):
+        """Forget (and uncache) the values of some keys."""
+        for key in keys:
+            self.memo.pop(key, None)
+        if self.cache is not None:
+            self.cache.delete_many(keys)
+
+    def add(self, key, value, timeout=None):
+        """Memoize (and cache) the value of a key if it is not set yet."""
+        if self.cache is not None:
+            # the cache decides which value wins
+            self.memo.pop(key, None)
+            return self.cache.add(key, value, timeout)
+        return self.memo.setdefault(key, value) is value
+
+    def incr(self, key):
+        """Increment the memoized (and cached) value of a key."""
+        if self.cache is not None:
+            self.memo.pop(key, None)
+            self.memo[key] = self.cache.incr(key)
+        elif key in self.memo:
+            self.memo[key] += 1
+        else:
+            raise ValueError('Key "{}" not found'.format(key))
+        return self.memo[key]
+
+
+def _get_translations_cache():
+    """
+    Return the cache of the translations (behind the memo of the current
+    request, if any), or `None` if both are disabled.
+    """
+    alias = getattr(settings, 'TRANSLATIONS_CACHE', None)
+    cache = None if alias is None else caches[alias]
+    memo = _translations_memo.get()
+    if memo is not None:
+        return _TranslationsMemo(memo, cache)
+    return cache
+
+
+def _get_translations_cache_generation_key(content_type_id, lang):
+    """Return the cache key of a content type's generation in a language."""
+    return 'translations:generation:{}:{}'.format(content_type_id, lang)
+
+
+def _get_translations_cache_generations(cache, pairs):
+    """
+    Return the generations of some content types in some languages in
+    a cache, as (content_type_id, lang).
+    """
+    keys = {
+        _get_translations_cache_generation_key(*pair): pair for pair in pairs
+    }
+    found = cache.get_many(list(keys))
+    missing = [key for key in keys if key not in found]
+    if missing:
+        # a lost generation starts over from a later one, so the entries of
+        # the lost one are never served again
+        generation = time.time_ns()
+        for key in missing:
+            cache.add(key, generation, None)
+        found.update(cache.get_many(missing))
+    return {pair: found[key] for (key, pair) in keys.items()}
+
+
+def _get_translations_cache_bucket(object_id):
+    """Return the bucket of an object id in the cached presences."""
+    # a suffix of the id, so the objects of a bucket can be looked up in
+    # any database
+    return str(object_id)[-2:]
+
+
+def _get_translations_cache_presence_key(content_type_id, lang, generation,
+                                         bucket):
+    """
+    Return the cache key of a bucket in a content type's presence in
+    a language (in a generation).
+    """
+    return 'translations:presence:{}:{}:{}:{}'.format(
+        content_type_id,
+        lang,
+        generation,
+        bucket,
+    )
+
+
+def _get_translations_cache_presences(cache, generations, objects,
+                                      using=None):
+    """
+    Return the ids of some objects' buckets which have translations, of
+    some content types in some languages (in some generations) in a cache,
+    or `None` if the cache is only a memo.
+    """
+    if isinstance(cache, _TranslationsMemo) and cache.cache is None:
+        # a presence does not outlive the request which builds it
+        return None
+
+    keys = {}
+    for ((ct_id, lang), generation) in generations.items():
+        for bucket in {
+            _get_translations_cache_bucket(obj_id)
+            for obj_id in objects.get(ct_id, ())
+        }:
+            key = _get_translations_cache_presence_key(
+                ct_id, lang, generation, bucket
+            )
+            keys[key] = (ct_id, lang, bucket)
+    found = cache.get_many(list(keys))
+    missing = {
+        keys[key]: key for key in keys if key not in found
+    }
+    if missing:
+        # only the missing buckets are built, in as few queries as the
+        # parameters allow
+        built = {key: set() for key in missing.values()}
+        clauses = [
+            models.Q(
+                content_type_id=ct_id,
+                language=lang,
+                **{
+                    'object_id__endswith' if len(bucket) > 1 else
+                    'object_id': bucket
+                }
+            )
+            for (ct_id, lang, bucket) in missing
+        ]
+        for start in range(0, len(clauses), 300):
+            for (ct_id, lang, obj_id) in translations.models.Translation \
+                    .objects.using(using).filter(
+                        models.Q(
+                            *clauses[start:start + 300],
+                            _connector=models.Q.OR
+                        ),
+                    ).order_by().values_list(
+                        'content_type_id', 'language', 'object_id',
+                    ).distinct():
+                # the suffixes may match case insensitively
+                key = missing.get(
+                    (ct_id, lang, _get_translations_cache_bucket(obj_id))
+                )
+                if key is not None:
+                    built[key].add(obj_id)
+        built = {key: frozenset(ids) for (key, ids) in built.items()}
+        cache.set_many(built)
+        found.update(built)
+
+    presences = {pair: set() for pair in generations}
+    for (key, (ct_id, lang, bucket)) in keys.items():
+        presences[(ct_id, lang)].update(found[key])
+    return {pair: frozenset(ids) for (pair, ids) in presences.items()}
+
+
+def _get_translations_cache_key(content_type_id, object_id, lang,
+                                generation):
+    """
+    Return the cache key of an object's translations in a language
+    (in a generation of its content type).
+    """
+    return 'translations:{}:{}:{}:{}'.format(
+        content_type_id,
+        object_id,
+        lang,
+        generation,
+    )
+
+
+def _clear_translations_cache(addresses, using=None):
+    """
+    Clear the cached translations of some objects in some languages,
+    as (content_type_id, object_id, lang).
+    """
+    cache = _get_translations_cache()
+    if cache is not None and addresses:
+        def clear():
+            generations = _get_translations_cache_generations(
+                cache,
+                {(ct_id, lang) for (ct_id, obj_id, lang) in addresses},
+            )
+            cache.delete_many([
+                _get_translations_cache_key(
+                    ct_id, obj_id, lang, generations[(ct_id, lang)]
+                ) for (ct_id, obj_id, lang) in addresses
+            ])
+
+        clear()
+        if transaction.get_connection(using).in_atomic_block:
+            # the cache may be filled again before the changes are visible
+            transaction.on_commit(clear, using=using)
+
+
+def _bump_translations_cache(pairs, using=None):
+    """
+    Clear the cached translations of some content types in some languages
+    at once by bumping their generations, as (content_type_id, lang).
+    ``None`` as the language means all the languages.
+    """
+    cache = _get_translations_cache()
+    if cache is not None and pairs:
+        keys = [
+            _get_translations_cache_generation_key(ct_id, code)
+            for (ct_id, lang) in pairs
+            for code in ([lang] if lang else _get_all_languages())
+        ]
+
+        def bump():
+            for key in keys:
+                try:
+                    cache.incr(key)
+                except ValueError:
+                    # a missing generation starts over from a later one
+                    pass
+
+        bump()
+        if transaction.get_connection(using).in_atomic_block:
+            # the cache may be filled again before the changes are visible
+            transaction.on_commit(bump, using=using)
+
+
+def _clear_translation_cache(sender, instance, using, created=False,
+                             **kwargs):
+    """Clear the cached translations of a `Translation` which changes."""
+    if created:
+        # the presences of the content type do not have the object yet,
+        # deleting its bucket would race with the readers rebuilding it
+        _bump_translations_cache(
+            [(instance.content_type_id, instance.language)],
+            using,
+        )
+    else:
+        _clear_translations_cache(
+            [(
+                instance.content_type_id,
+                instance.object_id,
+                instance.language,
+            )],
+            using,
+        )
+
+
+def _connect_translations_cache(setting='TRANSLATIONS_CACHE', **kwargs):
+    """
+    Connect the receivers which clear the cached translations if
+    the cache is enabled, and disconnect them otherwise.
+    """
+    if setting in ('TRANSLATIONS_CACHE', 'MIDDLEWARE'):
+        # the receivers prevent the fast deletes, keep them out if unused
+        middleware = getattr(settings, 'MIDDLEWARE', None) or ()
+        enabled = getattr(settings, 'TRANSLATIONS_CACHE', None) is not None \
+            or 'translations.middleware.memo_middleware' in middleware
+        for signal in (post_save, post_delete):
+            if enabled:
+                signal.connect(
+                    _clear_translation_cache,
+                    sender=translations.models.Translation,
+                    dispatch_uid='translations_cache',
+                )
+            else:
+                signal.disconnect(
+                    sender=translations.models.Translation,
+                    dispatch_uid='translations_cache',
+                )